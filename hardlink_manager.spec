@@ -33,6 +33,7 @@ a = Analysis(
         "hardlink_manager.ui.mirror_panel",
         "hardlink_manager.ui.search_panel",
         "hardlink_manager.utils",
+        "hardlink_manager.utils.fast_stat",
         "hardlink_manager.utils.filesystem",
     ],
     hookspath=[],
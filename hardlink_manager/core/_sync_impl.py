@@ -0,0 +1,215 @@
+"""Shared primitives behind the mirror group sync operations.
+
+The public functions in :mod:`hardlink_manager.core.sync` are thin
+wrappers around these helpers, so scanning, identity checks and the
+per-folder replication loop live in one place.
+"""
+
+import errno
+import os
+from typing import Callable, Iterator, Optional
+
+from hardlink_manager.core.hardlink_ops import create_hardlink
+from hardlink_manager.core.mirror_groups import MirrorGroup
+from hardlink_manager.utils.fast_stat import fast_dev_ino
+from hardlink_manager.utils.filesystem import create_symlink, norm_abspath, read_symlink_target
+
+
+_LINK_AT = os.link in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+"""Whether hardlinks can be created relative to an open directory fd."""
+
+
+def _try_dev_ino(path: str, synced: bool = False) -> Optional[tuple[int, int]]:
+    """Return ``(st_dev, st_ino)`` of *path* itself, or None if it is absent.
+
+    Symlinks are not followed. Pass *synced* when the answer decides
+    whether to unlink *path* (see :func:`fast_dev_ino`). Other OSErrors
+    (permissions, I/O) are re-raised so callers can decide.
+    """
+    try:
+        return fast_dev_ino(path, follow_symlinks=False, synced=synced)
+    except FileNotFoundError:
+        return None
+
+
+def _try_readlink(path: str) -> Optional[str]:
+    """Return the absolute target of the symlink at *path*, or None.
+
+    None means nothing exists at *path* or it is not a symlink; this costs
+    one ``readlink`` call instead of an ``islink`` check followed by a read.
+    """
+    try:
+        return read_symlink_target(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError as e:
+        if e.errno == errno.EINVAL:  # Exists, but is not a symlink
+            return None
+        raise
+
+
+def _entry_stat(entry: os.DirEntry) -> os.stat_result:
+    """Return lstat info for a directory entry, with a usable inode number.
+
+    On Windows ``DirEntry.stat()`` leaves ``st_ino`` as 0, so fall back to
+    a real ``os.stat`` there.
+    """
+    st = entry.stat(follow_symlinks=False)
+    if st.st_ino == 0:
+        st = os.stat(entry.path, follow_symlinks=False)
+    return st
+
+
+def _iter_tree(root: str,
+               taken: Optional[set[str]] = None) -> Iterator[tuple[os.DirEntry, str]]:
+    """Recursively yield ``(entry, rel_path)`` for files and folder symlinks.
+
+    Entry types come from the directory listing, so subdirectories are
+    recognised without an extra stat. Folder symlinks are yielded but never
+    descended into; symlinks to files (or broken ones) are ignored.
+
+    If *taken* is given, the relative path of every entry listed (of any
+    type) is added to it.
+    """
+    stack = [(root, "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = rel_dir + os.sep + entry.name if rel_dir else entry.name
+            if taken is not None:
+                taken.add(rel)
+            try:
+                if entry.is_symlink():
+                    if entry.is_dir():
+                        yield entry, rel
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, rel
+            except OSError:
+                continue
+
+
+def _link_bucket(dest_dir: str,
+                 items: list[tuple[str, str, str, Optional[str]]],
+                 ) -> list[tuple[str, str]]:
+    """Create the entries of one destination directory.
+
+    Each item is ``(source_path, dest_path, filename, symlink_target)``:
+    a hardlink to *source_path* when *symlink_target* is None, otherwise a
+    folder symlink pointing at *symlink_target*.
+
+    Returns the ``(dest_path, source_path)`` pairs that were created.
+    """
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
+    except OSError:
+        return []  # e.g. a file already occupies part of the directory path
+    dir_fds: Optional[dict[str, int]] = {} if _LINK_AT else None
+    done = []
+    try:
+        for source_path, dest_path, filename, symlink_target in items:
+            try:
+                if symlink_target is None:
+                    _make_hardlink(source_path, dir_fds, dest_dir, filename)
+                else:
+                    create_symlink(symlink_target, dest_path)
+                done.append((dest_path, source_path))
+            except (OSError, ValueError, FileExistsError):
+                continue
+    finally:
+        _close_dir_fds(dir_fds)
+    return done
+
+
+def _find_root_folder(file_path: str, group: MirrorGroup) -> Optional[str]:
+    """Return which of the group's folders contains file_path (or a parent of it)."""
+    file_path = norm_abspath(file_path)
+    for norm, norm_sep in group.normalized_folders():
+        if file_path == norm or file_path.startswith(norm_sep):
+            return norm
+    return None
+
+
+def _make_hardlink(source_path: str, dir_fds: Optional[dict[str, int]],
+                   dest_dir: str, filename: str) -> None:
+    """Hardlink *source_path* as *filename* inside *dest_dir*.
+
+    With *dir_fds* (POSIX), each destination directory is opened once and
+    links are made relative to its descriptor, so the kernel does not
+    resolve the directory path again for every file. The caller closes the
+    descriptors. Sources must already be known to be regular files.
+    """
+    if dir_fds is None:
+        create_hardlink(source_path, dest_dir, filename)
+        return
+    fd = dir_fds.get(dest_dir)
+    if fd is None:
+        fd = os.open(dest_dir, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_PATH", 0))
+        dir_fds[dest_dir] = fd
+    os.link(source_path, filename, dst_dir_fd=fd, follow_symlinks=False)
+
+
+def _close_dir_fds(dir_fds: Optional[dict[str, int]]) -> None:
+    for fd in (dir_fds or {}).values():
+        os.close(fd)
+
+
+def _replicate(rel_path: str, source_root: str,
+               folders: tuple[tuple[str, str], ...], ensured_dirs: set[str],
+               create: Callable[[str, str, str], None]) -> list[str]:
+    """Create the entry at *rel_path* in every folder except *source_root*.
+
+    Folders where the name is already taken are left alone: an existing
+    link needs no work and a different entry is never replaced. Missing
+    parent directories are created once per *ensured_dirs*, then
+    ``create(dest_dir, dest_path, filename)`` makes the entry.
+
+    Returns the destination paths that were created.
+    """
+    rel_dir, filename = os.path.split(rel_path)
+    created = []
+    for folder, folder_sep in folders:
+        if folder == source_root:
+            continue
+
+        dest_path = folder_sep + rel_path
+        try:
+            if _try_dev_ino(dest_path) is not None:
+                continue
+        except OSError:
+            continue
+
+        dest_dir = folder_sep + rel_dir if rel_dir else folder
+        try:
+            if dest_dir not in ensured_dirs:
+                os.makedirs(dest_dir, exist_ok=True)
+                ensured_dirs.add(dest_dir)
+            create(dest_dir, dest_path, filename)
+            created.append(dest_path)
+        except (OSError, ValueError):
+            continue
+    return created
+
+
+def _unlink_in_folder(folder_sep: str,
+                      jobs: list[tuple[str, str, tuple[int, int]]]) -> list[tuple[str, str]]:
+    """Unlink each job's copy under one group folder if it is the same file.
+
+    Returns ``(selected path, deleted path)`` pairs in job order.
+    """
+    deleted = []
+    for file_path, rel_path, target_id in jobs:
+        candidate = folder_sep + rel_path
+        try:
+            if _try_dev_ino(candidate, synced=True) == target_id:
+                os.unlink(candidate)
+                deleted.append((file_path, candidate))
+        except OSError:
+            continue
+    return deleted
@@ -87,18 +87,66 @@ def delete_hardlink(path: str) -> None:
     os.unlink(path)
 
 
-def find_all_hardlinks(file_path: str, search_dirs: list[str]) -> list[str]:
+def build_inode_index(search_dirs: list[str]) -> dict[tuple[int, int], list[str]]:
+    """Map ``(st_dev, st_ino)`` to the paths of multiply-linked files.
+
+    Walks *search_dirs* once with ``os.scandir``. Files with a single link
+    are left out, since they have no other names to look up, and each
+    directory is read once even if the search dirs overlap.
+
+    Returns:
+        Dict from file identity to the sorted, normalised paths found.
+    """
+    index: dict[tuple[int, int], list[str]] = {}
+    visited: set[str] = set()
+    stack = [os.path.normpath(os.path.abspath(d)) for d in search_dirs]
+    while stack:
+        dirpath = stack.pop()
+        if dirpath in visited:
+            continue
+        visited.add(dirpath)
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                if st.st_ino == 0:
+                    # Windows leaves the inode and link count out of DirEntry.stat()
+                    st = os.stat(entry.path, follow_symlinks=False)
+            except OSError:
+                continue
+            if st.st_nlink > 1:
+                index.setdefault((st.st_dev, st.st_ino), []).append(entry.path)
+    for paths in index.values():
+        paths.sort()
+    return index
+
+
+def find_all_hardlinks(file_path: str, search_dirs: list[str],
+                       index: Optional[dict[tuple[int, int], list[str]]] = None) -> list[str]:
     """Find all hardlinks to the same file across the given directories.
 
     Searches the specified directories (recursively) for files that share
-    the same inode as file_path.
+    the same inode as file_path. Symlinks are not followed: a symlink to
+    the file is a separate entry, not one of its hardlinks.
 
     Args:
         file_path: Path to the file whose hardlinks we want to find.
         search_dirs: List of directory paths to search within.
+        index: Optional result of :func:`build_inode_index` for
+            *search_dirs*. Its entries are re-checked instead of walking
+            the directories again.
 
     Returns:
-        List of paths that are hardlinks to the same file data,
+        Sorted list of paths that are hardlinks to the same file data,
         including file_path itself if it's within a search directory.
     """
     file_path = os.path.abspath(file_path)
@@ -106,8 +154,29 @@ def find_all_hardlinks(file_path: str, search_dirs: list[str]) -> list[str]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    target_st = os.stat(file_path)
+    if target_st.st_nlink == 1:
+        # A single link has nothing to find; skip walking the search dirs
+        normed = os.path.normpath(file_path)
+        for search_dir in search_dirs:
+            root = os.path.normpath(os.path.abspath(search_dir))
+            if normed == root or normed.startswith(root.rstrip(os.sep) + os.sep):
+                return [normed]
+        return []
+
+    if index is not None:
+        found = []
+        for path in index.get((target_st.st_dev, target_st.st_ino), []):
+            try:
+                st = os.stat(path, follow_symlinks=False)
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) == (target_st.st_dev, target_st.st_ino):
+                found.append(path)
+        return found
+
     target_inode = get_inode(file_path)
-    target_dev = os.stat(file_path).st_dev
+    target_dev = target_st.st_dev
     results = []
 
     for search_dir in search_dirs:
@@ -118,7 +187,7 @@ def find_all_hardlinks(file_path: str, search_dirs: list[str]) -> list[str]:
             for filename in filenames:
                 full_path = os.path.join(dirpath, filename)
                 try:
-                    st = os.stat(full_path)
+                    st = os.stat(full_path, follow_symlinks=False)
                     if st.st_ino == target_inode and st.st_dev == target_dev:
                         results.append(full_path)
                 except OSError:
@@ -1,5 +1,6 @@
 """Mirror group registry: data model and JSON persistence."""
 
+import functools
 import json
 import os
 import platform
@@ -8,6 +9,8 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Optional
 
+from hardlink_manager.utils.filesystem import norm_abspath
+
 
 MIRROR_MARKER = ".hardlink_mirror"
 """Hidden file placed in each folder that belongs to a confirmed mirror group."""
@@ -48,6 +51,16 @@ def remove_mirror_marker(folder: str) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_folders(folders: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Return ``(norm, norm_with_sep)`` for each folder path."""
+    result = []
+    for folder in folders:
+        norm = norm_abspath(folder)
+        result.append((norm, norm if norm.endswith(os.sep) else norm + os.sep))
+    return tuple(result)
+
+
 @dataclass
 class MirrorGroup:
     """A mirror group: a set of folders kept in sync via hardlinks."""
@@ -69,6 +82,14 @@ class MirrorGroup:
         names = [os.path.basename(f) or f for f in self.folders]
         return " + ".join(names)
 
+    def normalized_folders(self) -> tuple[tuple[str, str], ...]:
+        """Return ``(norm, norm_with_sep)`` pairs for the group's folders.
+
+        The pairs are cached per folder list, so prefix checks against the
+        group do no path normalisation or string concatenation.
+        """
+        return _normalize_folders(tuple(self.folders))
+
 
 DEFAULT_REGISTRY_FILENAME = "mirror_groups.json"
 
@@ -94,6 +115,11 @@ def _default_registry_path() -> str:
     return os.path.join(data_dir, DEFAULT_REGISTRY_FILENAME)
 
 
+def _path_components(norm_path: str) -> list[str]:
+    """Split a normalised absolute path into its non-empty components."""
+    return [part for part in norm_path.split(os.sep) if part]
+
+
 class MirrorGroupRegistry:
     """Persistent registry of mirror groups, backed by a JSON file."""
 
@@ -102,13 +128,62 @@ class MirrorGroupRegistry:
             path = _default_registry_path()
         self.path = os.path.abspath(path)
         self._groups: dict[str, MirrorGroup] = {}
+        self._version = 0
+        self._folder_index: Optional[dict[str, MirrorGroup]] = None
+        self._path_trie: Optional[dict] = None
+        self._sync_enabled_count = 0
+        self._display_names: dict[str, str] = {}
         self.load()
 
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change to the registry's groups.
+
+        Callers that cache lookups can compare it to detect staleness.
+        """
+        return self._version
+
+    @property
+    def group_count(self) -> int:
+        """Number of groups, without copying the group list."""
+        return len(self._groups)
+
+    @property
+    def sync_enabled_count(self) -> int:
+        """Number of groups with auto-sync turned on.
+
+        Kept up to date by the CRUD methods rather than counted, so it is
+        cheap enough to check for every filesystem event.
+        """
+        return self._sync_enabled_count
+
+    @property
+    def any_sync_enabled(self) -> bool:
+        """Whether at least one group has auto-sync turned on."""
+        return self._sync_enabled_count > 0
+
+    def _changed(self):
+        """Record a mutation and drop the derived lookup indexes."""
+        self._version += 1
+        self._folder_index = None
+        self._path_trie = None
+        self._display_names = {}
+
+    def group_display_name(self, group: MirrorGroup) -> str:
+        """Return ``group.auto_name()``, rendered once per registry version."""
+        name = self._display_names.get(group.id)
+        if name is None:
+            name = group.auto_name()
+            self._display_names[group.id] = name
+        return name
+
     # -- Persistence --
 
     def load(self):
         """Load mirror groups from the JSON file."""
         self._groups.clear()
+        self._sync_enabled_count = 0
+        self._changed()
         if not os.path.exists(self.path):
             return
         try:
@@ -126,6 +201,8 @@ class MirrorGroupRegistry:
                 self._groups[group.id] = group
         except (json.JSONDecodeError, OSError):
             pass
+        self._sync_enabled_count = sum(1 for g in self._groups.values() if g.sync_enabled)
+        self._changed()
 
     def save(self):
         """Save mirror groups to the JSON file."""
@@ -146,6 +223,8 @@ class MirrorGroupRegistry:
         if not group.name:
             group.name = group.auto_name()
         self._groups[group.id] = group
+        self._sync_enabled_count += group.sync_enabled
+        self._changed()
         self.save()
         for f in group.folders:
             write_mirror_marker(f, group.id)
@@ -176,8 +255,10 @@ class MirrorGroupRegistry:
             for added in new_set - old_set:
                 write_mirror_marker(added, group_id)
         if sync_enabled is not None:
+            self._sync_enabled_count += bool(sync_enabled) - group.sync_enabled
             group.sync_enabled = sync_enabled
         group.touch()
+        self._changed()
         self.save()
         return group
 
@@ -188,6 +269,8 @@ class MirrorGroupRegistry:
             for f in group.folders:
                 remove_mirror_marker(f)
             del self._groups[group_id]
+            self._sync_enabled_count -= group.sync_enabled
+            self._changed()
             self.save()
             return True
         return False
@@ -202,6 +285,7 @@ class MirrorGroupRegistry:
             group.folders.append(folder)
             group.name = group.auto_name()
             group.touch()
+            self._changed()
             self.save()
             write_mirror_marker(folder, group_id)
         return True
@@ -216,6 +300,7 @@ class MirrorGroupRegistry:
             group.folders.remove(folder)
             group.name = group.auto_name()
             group.touch()
+            self._changed()
             self.save()
             remove_mirror_marker(folder)
             return True
@@ -225,27 +310,54 @@ class MirrorGroupRegistry:
 
     def find_group_for_folder(self, folder: str) -> Optional[MirrorGroup]:
         """Find the mirror group that contains the given folder, if any."""
-        folder = os.path.normpath(os.path.abspath(folder))
-        for group in self._groups.values():
-            for gf in group.folders:
-                if os.path.normpath(os.path.abspath(gf)) == folder:
-                    return group
-        return None
+        folder = norm_abspath(folder)
+        index = self._folder_index
+        if index is None:
+            index = {}
+            for group in self._groups.values():
+                for norm_gf, _sep in group.normalized_folders():
+                    index.setdefault(norm_gf, group)
+            self._folder_index = index
+        return index.get(folder)
+
+    def _get_path_trie(self) -> dict:
+        """Return group folders as a trie keyed on path components.
+
+        Each node maps a component to its child node; the key None holds
+        the ``(group, group_folder)`` for a folder ending at that node.
+        """
+        trie = self._path_trie
+        if trie is None:
+            trie = {}
+            for group in self._groups.values():
+                for norm_gf, _sep in group.normalized_folders():
+                    node = trie
+                    for part in _path_components(norm_gf):
+                        node = node.setdefault(part, {})
+                    node.setdefault(None, (group, norm_gf))
+            self._path_trie = trie
+        return trie
 
     def find_group_for_path(self, path: str) -> Optional[tuple["MirrorGroup", str]]:
         """Find the mirror group that contains a path (file or subfolder).
 
         Returns (group, group_folder) where group_folder is the top-level
-        folder that is a parent of path, or None if no match.
+        folder that is a parent of path, or None if no match. If group
+        folders are nested, the innermost one wins.
         """
-        path = os.path.normpath(os.path.abspath(path))
-        for group in self._groups.values():
-            for gf in group.folders:
-                norm_gf = os.path.normpath(os.path.abspath(gf))
-                # path is inside (or equal to) this group folder
-                if path == norm_gf or path.startswith(norm_gf + os.sep):
-                    return (group, norm_gf)
-        return None
+        node = self._get_path_trie()
+        best = node.get(None)
+        for part in _path_components(norm_abspath(path)):
+            node = node.get(part)
+            if node is None:
+                break
+            best = node.get(None, best)
+        return best
+
+    def find_group_only(self, path: str) -> Optional["MirrorGroup"]:
+        """Like :meth:`find_group_for_path`, for callers that only need the group."""
+        result = self.find_group_for_path(path)
+        return result[0] if result is not None else None
 
     def is_folder_in_group(self, folder: str) -> bool:
         """Check if a folder belongs to any mirror group."""
@@ -276,7 +388,7 @@ class MirrorGroupRegistry:
         """
         import hashlib
 
-        root_folders = [os.path.normpath(os.path.abspath(f))
+        root_folders = [norm_abspath(f)
                         for f in root_folders if os.path.isdir(f)]
         if not root_folders:
             return [], []
@@ -355,7 +467,7 @@ class MirrorGroupRegistry:
         # Existing folder sets – skip already-registered groups
         existing_sets: list[set[str]] = []
         for group in self._groups.values():
-            norm = {os.path.normpath(os.path.abspath(f)) for f in group.folders}
+            norm = {norm_abspath(f) for f in group.folders}
             existing_sets.append(norm)
 
         auto_confirmed: list[list[str]] = []
@@ -398,7 +510,7 @@ class MirrorGroupRegistry:
         Returns:
             List of newly created MirrorGroup objects.
         """
-        folders = [os.path.normpath(os.path.abspath(f))
+        folders = [norm_abspath(f)
                    for f in folders if os.path.isdir(f)]
         if len(folders) < 2:
             return []
@@ -452,7 +564,7 @@ class MirrorGroupRegistry:
         # Determine existing folder sets to avoid duplicates
         existing_sets: list[set[str]] = []
         for group in self._groups.values():
-            norm = {os.path.normpath(os.path.abspath(f)) for f in group.folders}
+            norm = {norm_abspath(f) for f in group.folders}
             existing_sets.append(norm)
 
         new_groups = []
@@ -1,29 +1,42 @@
 """Sync operations for mirror groups: propagate files and folder symlinks."""
 
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-from hardlink_manager.core.hardlink_ops import create_hardlink, create_folder_symlink
+from hardlink_manager.core._sync_impl import (
+    _LINK_AT,
+    _close_dir_fds,
+    _entry_stat,
+    _find_root_folder,
+    _iter_tree,
+    _link_bucket,
+    _make_hardlink,
+    _replicate,
+    _try_readlink,
+    _unlink_in_folder,
+)
+from hardlink_manager.core.hardlink_ops import create_folder_symlink
 from hardlink_manager.core.mirror_groups import MIRROR_MARKER, MirrorGroup
+from hardlink_manager.utils.fast_stat import fast_dev_ino
 from hardlink_manager.utils.filesystem import (
     create_symlink,
-    get_inode,
     is_symlink,
+    norm_abspath,
     read_symlink_target,
 )
 
 
-def _find_root_folder(file_path: str, group: MirrorGroup) -> Optional[str]:
-    """Return which of the group's folders contains file_path (or a parent of it)."""
-    file_path = os.path.normpath(os.path.abspath(file_path))
-    for folder in group.folders:
-        norm = os.path.normpath(os.path.abspath(folder))
-        if file_path == norm or file_path.startswith(norm + os.sep):
-            return norm
-    return None
+PARALLEL_SYNC_MIN_FILES = 64
+"""Below this many unique files, sync_group creates hardlinks serially."""
+
+PARALLEL_DELETE_MIN_FOLDERS = 3
+"""Below this many group folders, delete_files_from_group unlinks serially."""
 
 
-def sync_file_to_group(source_path: str, group: MirrorGroup) -> list[str]:
+def sync_file_to_group(source_path: str, group: MirrorGroup,
+                       source_st: Optional[os.stat_result] = None) -> list[str]:
     """Create hardlinks for a file in all other folders of the mirror group.
 
     Handles files in subdirectories by computing the relative path from the
@@ -33,51 +46,68 @@ def sync_file_to_group(source_path: str, group: MirrorGroup) -> list[str]:
     Args:
         source_path: Path to the file that was added.
         group: The mirror group to sync across.
+        source_st: Stat result for the file, if the caller already has one;
+            saves re-statting the source.
 
     Returns:
         List of paths where new hardlinks were created.
     """
-    source_path = os.path.normpath(os.path.abspath(source_path))
-    if os.path.basename(source_path) == MIRROR_MARKER:
-        return []
-    source_root = _find_root_folder(source_path, group)
-    if source_root is None:
-        return []
+    source_path = norm_abspath(source_path)
+    source_stats = {source_path: source_st} if source_st is not None else None
+    return sync_files_to_group([source_path], group, source_stats).get(source_path, [])
 
-    rel_path = os.path.relpath(source_path, source_root)
-    source_inode = get_inode(source_path)
-    source_dev = os.stat(source_path).st_dev
 
-    created = []
-    for folder in group.folders:
-        folder = os.path.normpath(os.path.abspath(folder))
-        if folder == source_root:
-            continue
+def sync_files_to_group(paths: list[str], group: MirrorGroup,
+                        source_stats: Optional[dict[str, os.stat_result]] = None,
+                        ) -> dict[str, list[str]]:
+    """Create hardlinks for several files in all other folders of the group.
 
-        dest_path = os.path.join(folder, rel_path)
-        dest_dir = os.path.dirname(dest_path)
-        filename = os.path.basename(dest_path)
+    Batched form of :func:`sync_file_to_group`: the group's folders are
+    normalised once and each destination directory is created at most once,
+    however many of the files land in it. Files that have vanished or lie
+    outside the group are skipped.
 
-        # Already exists — check if same inode (already linked)
-        if os.path.exists(dest_path):
-            try:
-                st = os.stat(dest_path)
-                if st.st_ino == source_inode and st.st_dev == source_dev:
-                    continue  # Already hardlinked
-            except OSError:
-                pass
-            continue  # Different file with same name, skip
+    Args:
+        paths: Paths of the files that were added.
+        group: The mirror group to sync across.
+        source_stats: Optional stat results keyed by entries of *paths*;
+            files found here are not re-statted.
 
-        # Create intermediate directories as needed
-        os.makedirs(dest_dir, exist_ok=True)
+    Returns:
+        Dict mapping each source path to the hardlinks created for it.
+    """
+    folders = group.normalized_folders()
+    ensured_dirs: set[str] = set()
+    dir_fds: Optional[dict[str, int]] = {} if _LINK_AT else None
+    result: dict[str, list[str]] = {}
 
-        try:
-            create_hardlink(source_path, dest_dir, filename)
-            created.append(dest_path)
-        except (OSError, ValueError, FileExistsError):
-            continue
+    try:
+        for path in paths:
+            source_path = norm_abspath(path)
+            if os.path.basename(source_path) == MIRROR_MARKER:
+                continue
+            source_root = _find_root_folder(source_path, group)
+            if source_root is None:
+                continue
+            st = source_stats.get(path) if source_stats else None
+            if st is None:
+                try:
+                    st = os.lstat(source_path)
+                except OSError:
+                    continue  # Vanished since the caller saw it
+            if not stat.S_ISREG(st.st_mode):
+                continue
 
-    return created
+            rel_path = os.path.relpath(source_path, source_root)
+            created = _replicate(rel_path, source_root, folders, ensured_dirs,
+                                 lambda dest_dir, _dest_path, filename:
+                                 _make_hardlink(source_path, dir_fds, dest_dir, filename))
+            if created:
+                result[source_path] = created
+    finally:
+        _close_dir_fds(dir_fds)
+
+    return result
 
 
 def sync_symlink_to_group(symlink_path: str, group: MirrorGroup) -> list[str]:
@@ -94,44 +124,49 @@ def sync_symlink_to_group(symlink_path: str, group: MirrorGroup) -> list[str]:
     Returns:
         List of paths where new symlinks were created.
     """
-    symlink_path = os.path.normpath(os.path.abspath(symlink_path))
-    source_root = _find_root_folder(symlink_path, group)
-    if source_root is None:
-        return []
+    symlink_path = norm_abspath(symlink_path)
+    return sync_symlinks_to_group([symlink_path], group).get(symlink_path, [])
 
-    if not os.path.islink(symlink_path):
-        return []
-
-    target = read_symlink_target(symlink_path)
-    rel_path = os.path.relpath(symlink_path, source_root)
-
-    created = []
-    for folder in group.folders:
-        folder = os.path.normpath(os.path.abspath(folder))
-        if folder == source_root:
-            continue
 
-        dest_path = os.path.join(folder, rel_path)
+def sync_symlinks_to_group(paths: list[str], group: MirrorGroup) -> dict[str, list[str]]:
+    """Replicate several folder symlinks to all other folders of the group.
 
-        # Already exists — check if it's a symlink to the same target
-        if os.path.islink(dest_path):
-            existing_target = read_symlink_target(dest_path)
-            if os.path.normpath(existing_target) == os.path.normpath(target):
-                continue  # Already correct
-            continue  # Different symlink, don't overwrite
-        if os.path.exists(dest_path):
-            continue  # Regular file/dir with same name, skip
+    Batched form of :func:`sync_symlink_to_group`, sharing the group's
+    normalised folders and the set of already-created parent directories
+    across all symlinks. Paths that are not (or no longer) symlinks are
+    skipped.
 
-        dest_dir = os.path.dirname(dest_path)
-        os.makedirs(dest_dir, exist_ok=True)
+    Args:
+        paths: Paths of the symlinks that were created.
+        group: The mirror group to sync across.
 
+    Returns:
+        Dict mapping each symlink path to the symlinks created for it.
+    """
+    folders = group.normalized_folders()
+    ensured_dirs: set[str] = set()
+    result: dict[str, list[str]] = {}
+
+    for path in paths:
+        symlink_path = norm_abspath(path)
+        source_root = _find_root_folder(symlink_path, group)
+        if source_root is None:
+            continue
         try:
-            create_symlink(target, dest_path)
-            created.append(dest_path)
-        except (OSError, FileExistsError):
+            target = _try_readlink(symlink_path)
+        except OSError:
+            continue
+        if target is None:
             continue
 
-    return created
+        rel_path = os.path.relpath(symlink_path, source_root)
+        created = _replicate(rel_path, source_root, folders, ensured_dirs,
+                             lambda _dest_dir, dest_path, _filename:
+                             create_symlink(target, dest_path))
+        if created:
+            result[symlink_path] = created
+
+    return result
 
 
 def delete_symlink_from_group(symlink_path: str, group: MirrorGroup) -> list[str]:
@@ -146,26 +181,25 @@ def delete_symlink_from_group(symlink_path: str, group: MirrorGroup) -> list[str
     Returns:
         List of paths that were deleted.
     """
-    symlink_path = os.path.normpath(os.path.abspath(symlink_path))
+    symlink_path = norm_abspath(symlink_path)
     root_folder = _find_root_folder(symlink_path, group)
     if root_folder is None:
         return []
 
-    if not os.path.islink(symlink_path):
+    target = _try_readlink(symlink_path)
+    if target is None:
         return []
-
-    target = read_symlink_target(symlink_path)
+    norm_target = os.path.normpath(target)
     rel_path = os.path.relpath(symlink_path, root_folder)
 
     deleted = []
-    for folder in group.folders:
-        folder = os.path.normpath(os.path.abspath(folder))
-        candidate = os.path.join(folder, rel_path)
-        if not os.path.islink(candidate):
-            continue
+    for _folder, folder_sep in group.normalized_folders():
+        candidate = folder_sep + rel_path
         try:
-            candidate_target = read_symlink_target(candidate)
-            if os.path.normpath(candidate_target) == os.path.normpath(target):
+            candidate_target = _try_readlink(candidate)
+            if candidate_target is None:
+                continue
+            if os.path.normpath(candidate_target) == norm_target:
                 os.unlink(candidate)
                 deleted.append(candidate)
         except OSError:
@@ -191,91 +225,82 @@ def sync_group(group: MirrorGroup) -> dict[str, list[str]]:
     unique_files: dict[tuple[int, int], tuple[str, str]] = {}
     # Collect symlinks by (relative_path, target) -> source symlink path
     unique_symlinks: dict[tuple[str, str], str] = {}
+    # Every relative path listed in each folder. Together with the inode
+    # dedup above this decides every destination without another stat.
+    present: dict[str, set[str]] = {}
 
     for folder in group.folders:
-        folder = os.path.normpath(os.path.abspath(folder))
+        folder = norm_abspath(folder)
+        taken = present.setdefault(folder, set())
         if not os.path.isdir(folder):
             continue
-        for dirpath, dirnames, filenames in os.walk(folder):
-            # Detect folder symlinks among directory entries (os.walk
-            # yields them in dirnames but does not follow them by default).
-            symlink_dirs = []
-            for dname in dirnames:
-                dpath = os.path.join(dirpath, dname)
-                if os.path.islink(dpath):
-                    symlink_dirs.append(dname)
-                    try:
-                        target = read_symlink_target(dpath)
-                        rel = os.path.relpath(dpath, folder)
-                        key = (rel, os.path.normpath(target))
-                        if key not in unique_symlinks:
-                            unique_symlinks[key] = dpath
-                    except OSError:
-                        continue
-            # Remove symlink dirs so os.walk does not descend into them
-            for sd in symlink_dirs:
-                dirnames.remove(sd)
-
-            for fname in filenames:
-                if fname == MIRROR_MARKER:
-                    continue
-                full_path = os.path.join(dirpath, fname)
+        for entry, rel in _iter_tree(folder, taken):
+            if entry.is_symlink():
                 try:
-                    # Use os.stat() — DirEntry.stat() on Windows doesn't
-                    # populate st_ino
-                    st = os.stat(full_path)
-                    key = (st.st_dev, st.st_ino)
-                    if key not in unique_files:
-                        rel = os.path.relpath(full_path, folder)
-                        unique_files[key] = (full_path, rel)
+                    target = read_symlink_target(entry.path)
                 except OSError:
                     continue
-
-    # For each unique file, ensure it exists at the same relative path in all folders
-    created: dict[str, str] = {}
-    for (dev, inode), (source_path, rel_path) in unique_files.items():
-        for folder in group.folders:
-            folder = os.path.normpath(os.path.abspath(folder))
-            dest_path = os.path.join(folder, rel_path)
-
-            if os.path.exists(dest_path):
-                try:
-                    st = os.stat(dest_path)
-                    if st.st_ino == inode and st.st_dev == dev:
-                        continue  # Already linked
-                except OSError:
-                    pass
-                continue  # Different file with same name, skip
-
-            dest_dir = os.path.dirname(dest_path)
-            os.makedirs(dest_dir, exist_ok=True)
+                key = (rel, os.path.normpath(target))
+                if key not in unique_symlinks:
+                    unique_symlinks[key] = entry.path
+                continue
+            if entry.name == MIRROR_MARKER:
+                continue
             try:
-                create_hardlink(source_path, dest_dir, os.path.basename(rel_path))
-                created[dest_path] = source_path
-            except (OSError, ValueError, FileExistsError):
+                st = _entry_stat(entry)
+            except OSError:
                 continue
-
-    # For each unique symlink, ensure it exists at the same relative path in all folders
+            key = (st.st_dev, st.st_ino)
+            if key not in unique_files:
+                unique_files[key] = (entry.path, rel)
+
+    # Plan the missing entries one destination folder at a time: files in
+    # (dev, inode) order so the links touch neighbouring inode-table
+    # blocks, then folder symlinks. Work is bucketed by
+    # destination directory: os.link and symlink serialise on the parent
+    # directory, so distinct directories can be filled concurrently.
+    files = []
+    for _source_id, (source_path, rel_path) in sorted(unique_files.items()):
+        rel_dir, filename = os.path.split(rel_path)
+        files.append((source_path, rel_path, rel_dir, filename))
+    symlinks = []
     for (rel_path, norm_target), source_symlink in unique_symlinks.items():
-        for folder in group.folders:
-            folder = os.path.normpath(os.path.abspath(folder))
-            dest_path = os.path.join(folder, rel_path)
-
-            if os.path.islink(dest_path):
-                existing = read_symlink_target(dest_path)
-                if os.path.normpath(existing) == norm_target:
-                    continue  # Already correct
-                continue  # Different symlink, skip
-            if os.path.exists(dest_path):
-                continue  # Name taken by a regular entry, skip
-
-            dest_dir = os.path.dirname(dest_path)
-            os.makedirs(dest_dir, exist_ok=True)
-            try:
-                create_symlink(norm_target, dest_path)
-                created[dest_path] = source_symlink
-            except (OSError, FileExistsError):
+        rel_dir, filename = os.path.split(rel_path)
+        symlinks.append((norm_target, source_symlink, rel_path, rel_dir, filename))
+
+    buckets: dict[str, list[tuple[str, str, str, Optional[str]]]] = {}
+    for folder, folder_sep in group.normalized_folders():
+        taken = present[folder]
+
+        for source_path, rel_path, rel_dir, filename in files:
+            if rel_path in taken:
+                # The scan saw this name here: either it is already a link
+                # to the file (the scan deduplicated it by inode) or it is
+                # a different entry, which is never overwritten.
                 continue
+            dest_dir = folder_sep + rel_dir if rel_dir else folder
+            buckets.setdefault(dest_dir, []).append(
+                (source_path, folder_sep + rel_path, filename, None))
+
+        for norm_target, source_symlink, rel_path, rel_dir, filename in symlinks:
+            if rel_path in taken:
+                # Either this very symlink, a different one, or a regular
+                # entry with the same name; none of them is overwritten.
+                continue
+            dest_dir = folder_sep + rel_dir if rel_dir else folder
+            buckets.setdefault(dest_dir, []).append(
+                (source_symlink, folder_sep + rel_path, filename, norm_target))
+
+    created: dict[str, str] = {}
+    if len(unique_files) < PARALLEL_SYNC_MIN_FILES or len(buckets) < 2:
+        for dest_dir, items in buckets.items():
+            created.update(_link_bucket(dest_dir, items))
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(buckets))) as pool:
+            futures = [pool.submit(_link_bucket, dest_dir, items)
+                       for dest_dir, items in buckets.items()]
+            for future in as_completed(futures):
+                created.update(future.result())
 
     return created
 
@@ -293,31 +318,59 @@ def delete_from_group(file_path: str, group: MirrorGroup) -> list[str]:
     Returns:
         List of paths that were deleted.
     """
-    file_path = os.path.normpath(os.path.abspath(file_path))
-    root_folder = _find_root_folder(file_path, group)
-    if root_folder is None:
-        return []
+    file_path = norm_abspath(file_path)
+    return delete_files_from_group([file_path], group).get(file_path, [])
 
-    try:
-        target_inode = get_inode(file_path)
-        target_dev = os.stat(file_path).st_dev
-    except OSError:
-        return []
 
-    rel_path = os.path.relpath(file_path, root_folder)
-    deleted = []
+def delete_files_from_group(paths: list[str], group: MirrorGroup) -> dict[str, list[str]]:
+    """Delete several files from ALL folders in a mirror group.
 
-    for folder in group.folders:
-        folder = os.path.normpath(os.path.abspath(folder))
-        candidate = os.path.join(folder, rel_path)
-        if not os.path.exists(candidate):
+    Batch form of :func:`delete_from_group`: each parent directory's group
+    folder is resolved once, and selected paths that are mirror copies of
+    each other (same file at the same relative path) are deleted once.
+
+    Args:
+        paths: Paths to the files being deleted.
+        group: The mirror group.
+
+    Returns:
+        Dict mapping each handled path to the paths that were deleted for it.
+        Paths outside the group, already gone, or covered by an earlier copy
+        are left out.
+    """
+    folders = group.normalized_folders()
+    roots: dict[str, Optional[str]] = {}
+    seen: set[tuple[tuple[int, int], str]] = set()
+    jobs: list[tuple[str, str, tuple[int, int]]] = []
+
+    for file_path in paths:
+        file_path = norm_abspath(file_path)
+        parent = os.path.dirname(file_path)
+        if parent not in roots:
+            roots[parent] = _find_root_folder(parent, group)
+        root_folder = roots[parent]
+        if root_folder is None:
             continue
         try:
-            st = os.stat(candidate)
-            if st.st_ino == target_inode and st.st_dev == target_dev:
-                os.unlink(candidate)
-                deleted.append(candidate)
+            target_id = fast_dev_ino(file_path, synced=True)
         except OSError:
             continue
-
-    return deleted
+        rel_path = os.path.relpath(file_path, root_folder)
+        if (target_id, rel_path) in seen:
+            continue
+        seen.add((target_id, rel_path))
+        jobs.append((file_path, rel_path, target_id))
+
+    if len(folders) < PARALLEL_DELETE_MIN_FOLDERS:
+        per_folder = [_unlink_in_folder(folder_sep, jobs) for _folder, folder_sep in folders]
+    else:
+        # Each unlink is a blocking syscall; spreading the folders over a
+        # few threads overlaps them on slow disks
+        with ThreadPoolExecutor(max_workers=min(8, len(folders))) as pool:
+            per_folder = list(pool.map(lambda f: _unlink_in_folder(f[1], jobs), folders))
+
+    result: dict[str, list[str]] = {file_path: [] for file_path, _rel, _id in jobs}
+    for deleted in per_folder:
+        for file_path, candidate in deleted:
+            result[file_path].append(candidate)
+    return result
@@ -1,23 +1,53 @@
 """Filesystem watcher for mirror group auto-sync with debouncing."""
 
+import heapq
 import os
+import stat
 import threading
 import time
+from collections import OrderedDict
 from typing import Callable, Optional
 
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import (
     FileSystemEventHandler,
     FileCreatedEvent,
     DirCreatedEvent,
+    DirMovedEvent,
+    FileMovedEvent,
 )
 
 from hardlink_manager.core.mirror_groups import MirrorGroup, MirrorGroupRegistry
-from hardlink_manager.core.sync import sync_file_to_group, sync_symlink_to_group
+from hardlink_manager.core.sync import sync_files_to_group, sync_symlinks_to_group
+from hardlink_manager.utils.filesystem import is_network_path, norm_abspath
+
+
+_DIR_CACHE_SIZE = 1024
+"""Number of directories whose mirror group a handler remembers."""
+
+NETWORK_POLL_SECONDS = 60.0
+"""Default polling interval for folders on network filesystems."""
+
+_WATCHED_EVENTS = [FileCreatedEvent, DirCreatedEvent, FileMovedEvent, DirMovedEvent]
+"""Event types delivered to the handler.
+
+Native backends narrow their OS subscription to match (on Linux the
+inotify mask becomes IN_CREATE | IN_MOVE instead of every event), so
+reads, writes and attribute changes inside watched trees never wake
+Python at all.
+"""
 
 
 class _DebouncedHandler(FileSystemEventHandler):
-    """Handles filesystem events with debouncing to avoid duplicate syncs."""
+    """Handles filesystem events with debouncing to avoid duplicate syncs.
+
+    Pending paths are drained by one long-lived worker thread that sleeps on
+    a condition variable until the earliest debounce deadline, so bursts of
+    events never spawn extra threads. The worker starts with the first
+    scheduled event, so idle handlers cost no thread at all.
+    """
 
     def __init__(self, registry: MirrorGroupRegistry,
                  on_sync: Optional[Callable[[str, list[str]], None]] = None,
@@ -26,107 +56,229 @@ class _DebouncedHandler(FileSystemEventHandler):
         self.registry = registry
         self.on_sync = on_sync
         self.debounce_seconds = debounce_seconds
-        self._pending: dict[str, float] = {}  # path -> scheduled time
-        self._lock = threading.Lock()
-        self._timer: Optional[threading.Timer] = None
+        self._pending: dict[str, float] = {}  # path -> latest scheduled time
+        # (scheduled time, path) min-heap; entries superseded by a later
+        # reschedule of the same path are skipped when popped.
+        self._heap: list[tuple[float, str]] = []
+        self._cv = threading.Condition()
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+        # parent directory -> find_group_for_path() result, most recent last.
+        # Guarded by its own lock so lookups never contend with scheduling.
+        self._cache_lock = threading.Lock()
+        self._dir_groups: OrderedDict[str, Optional[tuple[MirrorGroup, str]]] = OrderedDict()
+        self._dir_groups_version = registry.version
+
+    def stop(self, timeout: Optional[float] = 2.0):
+        """Stop the worker thread; pending syncs are dropped.
+
+        The worker is woken through the condition variable and exits at
+        once, or after the group batch it is syncing; this waits up to
+        *timeout* seconds for that.
+        """
+        with self._cv:
+            self._stopped = True
+            self._pending.clear()
+            self._heap.clear()
+            self._cv.notify()
+            worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
 
     def on_created(self, event):
-        src_path = os.path.abspath(event.src_path)
-
-        # Handle directory creation events: sync if it's a symlink folder
-        if event.is_directory or isinstance(event, DirCreatedEvent):
-            if os.path.islink(src_path):
-                result = self.registry.find_group_for_path(src_path)
-                if result is None:
-                    return
-                group, _root_folder = result
-                if not group.sync_enabled:
-                    return
-                # Schedule symlink sync through the same debounce path
-                with self._lock:
-                    self._pending[src_path] = time.time() + self.debounce_seconds
-                    if self._timer is None or not self._timer.is_alive():
-                        self._timer = threading.Timer(self.debounce_seconds, self._flush)
-                        self._timer.daemon = True
-                        self._timer.start()
-            return
+        self._on_new_entry(event.src_path, event.is_directory)
 
-        if not isinstance(event, FileCreatedEvent):
+    def on_moved(self, event):
+        # Editors and downloaders often write a temporary file and rename
+        # it into place; the final name only ever shows up here. The
+        # temporary name is simply gone by the time its sync is flushed.
+        self._on_new_entry(event.dest_path, event.is_directory)
+
+    def _on_new_entry(self, path: str, is_directory: bool):
+        """Schedule a sync for an entry that appeared at *path*."""
+        if not self.registry.any_sync_enabled:
+            return  # Sync switched off everywhere since the watch started
+        if not os.path.isabs(path):
+            # Watches are scheduled on absolute, normalised roots, so
+            # watchdog normally hands over usable paths as they are.
+            path = os.path.abspath(path)
+
+        # Only creation and move events are delivered (see _WATCHED_EVENTS).
+        # Plain directories need no sync of their own; folder symlinks do.
+        if is_directory and not os.path.islink(path):
             return
 
         # Check if this path is inside a sync-enabled mirror group folder
-        result = self.registry.find_group_for_path(src_path)
+        result = self._find_group(path)
         if result is None:
             return
         group, _root_folder = result
         if not group.sync_enabled:
             return
 
-        # Debounce: schedule the sync
-        with self._lock:
-            self._pending[src_path] = time.time() + self.debounce_seconds
-            if self._timer is None or not self._timer.is_alive():
-                self._timer = threading.Timer(self.debounce_seconds, self._flush)
-                self._timer.daemon = True
-                self._timer.start()
-
-    def _flush(self):
-        """Process pending syncs whose debounce period has elapsed."""
-        now = time.time()
-        to_sync = []
-        reschedule = False
-
-        with self._lock:
-            remaining = {}
-            for path, scheduled_time in self._pending.items():
-                if now >= scheduled_time:
-                    to_sync.append(path)
-                else:
-                    remaining[path] = scheduled_time
-                    reschedule = True
-            self._pending = remaining
-
-            if reschedule:
-                delay = min(remaining.values()) - now
-                self._timer = threading.Timer(max(delay, 0.05), self._flush)
-                self._timer.daemon = True
-                self._timer.start()
-            else:
-                self._timer = None
+        # Debounce: schedule the sync; files and symlinks are told apart
+        # when the batch is flushed.
+        self._schedule(path)
 
-        # Perform syncs outside the lock
+    def _find_group(self, path: str) -> Optional[tuple[MirrorGroup, str]]:
+        """Return the mirror group containing *path*, cached per directory.
+
+        Group membership is decided by the containing directory, so a burst
+        of events in one folder costs a single registry lookup. The cache is
+        dropped whenever the registry changes.
+        """
+        parent = os.path.dirname(path)
+        with self._cache_lock:
+            if self._dir_groups_version != self.registry.version:
+                self._dir_groups.clear()
+                self._dir_groups_version = self.registry.version
+            try:
+                self._dir_groups.move_to_end(parent)
+                return self._dir_groups[parent]
+            except KeyError:
+                pass
+        result = self.registry.find_group_for_path(parent)
+        with self._cache_lock:
+            self._dir_groups[parent] = result
+            if len(self._dir_groups) > _DIR_CACHE_SIZE:
+                self._dir_groups.popitem(last=False)
+        return result
+
+    def _schedule(self, path: str):
+        """(Re)start the debounce period for *path*."""
+        with self._cv:
+            if self._stopped:
+                return
+            was_idle = not self._pending
+            deadline = time.monotonic() + self.debounce_seconds
+            self._pending[path] = deadline
+            heapq.heappush(self._heap, (deadline, path))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="mirror-sync-debounce", daemon=True)
+                self._worker.start()
+            elif was_idle:
+                # A busy worker already wakes at an earlier deadline.
+                self._cv.notify()
+
+    def _run(self):
+        """Worker loop: wait for due paths and sync them outside the lock."""
+        while True:
+            with self._cv:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    to_sync = []
+                    while self._heap and self._heap[0][0] <= now:
+                        scheduled_time, path = heapq.heappop(self._heap)
+                        if self._pending.get(path) == scheduled_time:
+                            del self._pending[path]
+                            to_sync.append(path)
+                    if to_sync:
+                        break
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._cv.wait(timeout)
+            self._flush(to_sync)
+
+    def _flush(self, to_sync: list[str]):
+        """Sync paths whose debounce period has elapsed."""
+        # Perform syncs outside the lock, batched per group and kind so a
+        # burst of new entries shares one pass over the group's folders.
+        files_by_group: dict[str, tuple[MirrorGroup, list[str]]] = {}
+        symlinks_by_group: dict[str, tuple[MirrorGroup, list[str]]] = {}
+        stats: dict[str, os.stat_result] = {}
+        # The same file showing up at one relative path in several of a
+        # group's folders (e.g. links made by an earlier sync) needs only
+        # one representative: replicating it skips the others.
+        seen_files: set[tuple[str, int, int, str]] = set()
         for path in to_sync:
-            if not os.path.islink(path) and not os.path.exists(path):
-                continue
-            result = self.registry.find_group_for_path(path)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue  # Gone again before the debounce expired
+            result = self._find_group(path)
             if result is None:
                 continue
-            group, _root_folder = result
+            group, root_folder = result
             if not group.sync_enabled:
                 continue
-            try:
-                if os.path.islink(path):
-                    created = sync_symlink_to_group(path, group)
-                else:
-                    created = sync_file_to_group(path, group)
-                if created and self.on_sync:
+            if stat.S_ISLNK(st.st_mode):
+                symlinks_by_group.setdefault(group.id, (group, []))[1].append(path)
+            else:
+                key = (group.id, st.st_dev, st.st_ino, os.path.relpath(path, root_folder))
+                if key in seen_files:
+                    continue
+                seen_files.add(key)
+                stats[path] = st
+                files_by_group.setdefault(group.id, (group, []))[1].append(path)
+
+        batches = [(sync_symlinks_to_group, paths, group)
+                   for group, paths in symlinks_by_group.values()]
+        batches += [(sync_files_to_group, paths, group, stats)
+                    for group, paths in files_by_group.values()]
+        for sync, *args in batches:
+            if self._stopped:
+                return  # Watcher shut down mid-flush; drop the rest
+            self._report(sync, *args)
+
+    def _report(self, sync: Callable[..., dict[str, list[str]]], *args):
+        """Run one batched sync and pass each result to ``on_sync``."""
+        try:
+            synced = sync(*args)
+            if self.on_sync:
+                for path, created in synced.items():
                     self.on_sync(path, created)
-            except Exception:
-                pass  # Don't crash the watcher thread
+        except Exception:
+            pass  # Don't crash the watcher thread
+
+
+def _covering_roots(folders: list[str]) -> list[str]:
+    """Return the minimal set of *folders* whose subtrees cover them all.
+
+    Folders nested inside another listed folder are dropped, since a
+    recursive watch on the outer one already reports their events.
+    """
+    roots: list[str] = []
+    for folder in sorted(set(folders)):
+        if not any(folder.startswith(root if root.endswith(os.sep) else root + os.sep)
+                   for root in roots):
+            roots.append(folder)
+    return roots
 
 
 class MirrorGroupWatcher:
-    """Watches mirror group folders for file additions and auto-syncs."""
+    """Watches mirror group folders for file additions and auto-syncs.
+
+    Folders on local disks use the platform's native observer. Folders on
+    network filesystems, where native notifications miss remote changes,
+    are polled by a separate observer every *network_poll_seconds*.
+
+    With *force_polling*, local folders are polled too (watchdog compares
+    directory snapshots of mtime, size and inode), for setups where native
+    notifications are unreliable or too costly.
+
+    :meth:`start` (re)builds every watch from the registry; :meth:`refresh`
+    applies only the differences, and :meth:`add_group` and
+    :meth:`add_folder` extend a running watcher without touching the
+    watches it already has.
+    """
 
     def __init__(self, registry: MirrorGroupRegistry,
                  on_sync: Optional[Callable[[str, list[str]], None]] = None,
-                 debounce_seconds: float = 0.5):
+                 debounce_seconds: float = 0.5,
+                 network_poll_seconds: float = NETWORK_POLL_SECONDS,
+                 force_polling: bool = False):
         self.registry = registry
         self.on_sync = on_sync
         self.debounce_seconds = debounce_seconds
-        self._observer: Optional[Observer] = None
+        self.network_poll_seconds = network_poll_seconds
+        self.force_polling = force_polling
+        # "native", "polling" (native fallback) or "network" -> observer
+        self._observers: dict[str, Observer] = {}
         self._handler: Optional[_DebouncedHandler] = None
-        self._watched_paths: set[str] = set()
+        # watched root -> (observer, watch)
+        self._watches: dict[str, tuple[Observer, ObservedWatch]] = {}
 
     def start(self):
         """Start watching all sync-enabled mirror group folders."""
@@ -136,33 +288,121 @@ class MirrorGroupWatcher:
             on_sync=self.on_sync,
             debounce_seconds=self.debounce_seconds,
         )
-        self._observer = Observer()
-        self._watched_paths.clear()
 
+        self._get_observer("polling" if self.force_polling else "native")
+        self._watch(self._sync_folders())
+
+    def _sync_folders(self) -> list[str]:
+        """Existing folders of all sync-enabled groups."""
+        folders = []
         for group in self.registry.get_all_groups():
             if not group.sync_enabled:
                 continue
-            for folder in group.folders:
-                folder = os.path.abspath(folder)
-                if os.path.isdir(folder) and folder not in self._watched_paths:
-                    self._observer.schedule(self._handler, folder, recursive=True)
-                    self._watched_paths.add(folder)
+            for folder, _sep in group.normalized_folders():
+                if os.path.isdir(folder):
+                    folders.append(folder)
+        return folders
+
+    def add_group(self, group: MirrorGroup):
+        """Start watching a new or newly sync-enabled *group*."""
+        if not group.sync_enabled:
+            return
+        if self._handler is None:
+            self.start()
+            return
+        self._watch([folder for folder, _sep in group.normalized_folders()
+                     if os.path.isdir(folder)])
+
+    def add_folder(self, group: MirrorGroup, folder: str):
+        """Start watching *folder*, just added to *group*."""
+        if not group.sync_enabled:
+            return
+        if self._handler is None:
+            self.start()
+            return
+        folder = norm_abspath(folder)
+        if os.path.isdir(folder):
+            self._watch([folder])
+
+    def _watch(self, folders: list[str]):
+        """Extend the watched roots so that they cover *folders*.
 
-        self._observer.daemon = True
-        self._observer.start()
+        Roots that a new folder contains are replaced by it, since a
+        recursive watch on the outer folder reports their events too.
+        """
+        current = set(self._watches)
+        roots = _covering_roots(list(current) + folders)
+        for root in current.difference(roots):
+            observer, watch = self._watches.pop(root)
+            observer.unschedule(watch)
+        for root in roots:
+            if root not in current:
+                self._watches[root] = self._schedule_root(root)
+
+    def _schedule_root(self, root: str):
+        """Watch *root* recursively on the observer suited to its filesystem."""
+        if is_network_path(root):
+            kind = "network"
+        else:
+            kind = "polling" if self.force_polling else "native"
+        try:
+            observer = self._get_observer(kind)
+            watch = observer.schedule(self._handler, root, recursive=True,
+                                      event_filter=_WATCHED_EVENTS)
+        except OSError:
+            if kind != "native":
+                raise
+            # Native backends can fail outright, e.g. when the inotify watch
+            # limit is exhausted; polling is slower but always available.
+            observer = self._get_observer("polling")
+            watch = observer.schedule(self._handler, root, recursive=True,
+                                      event_filter=_WATCHED_EVENTS)
+        return observer, watch
+
+    def _get_observer(self, kind: str):
+        """Return the running observer of *kind*, starting it if needed."""
+        observer = self._observers.get(kind)
+        if observer is None:
+            if kind == "native":
+                observer = Observer()
+            elif kind == "network":
+                observer = PollingObserver(timeout=self.network_poll_seconds)
+            else:
+                observer = PollingObserver()
+            observer.daemon = True
+            observer.start()
+            self._observers[kind] = observer
+        return observer
 
     def stop(self):
         """Stop watching all folders."""
-        if self._observer is not None:
-            self._observer.stop()
-            self._observer.join(timeout=2)
-            self._observer = None
-        self._watched_paths.clear()
+        for observer in self._observers.values():
+            observer.stop()
+        for observer in self._observers.values():
+            observer.join(timeout=2)
+        self._observers.clear()
+        self._watches.clear()
+        if self._handler is not None:
+            self._handler.stop()
+            self._handler = None
 
     def refresh(self):
-        """Restart the watcher to pick up registry changes."""
-        self.start()
+        """Bring the watched roots in line with the registry.
+
+        A running watcher keeps its observers and the watches on roots that
+        are still wanted; only the differences are scheduled or dropped.
+        """
+        if self._handler is None:
+            self.start()
+            return
+        wanted = _covering_roots(self._sync_folders())
+        for root in set(self._watches).difference(wanted):
+            observer, watch = self._watches.pop(root)
+            observer.unschedule(watch)
+        for root in wanted:
+            if root not in self._watches:
+                self._watches[root] = self._schedule_root(root)
 
     @property
     def is_running(self) -> bool:
-        return self._observer is not None and self._observer.is_alive()
+        return any(observer.is_alive() for observer in self._observers.values())
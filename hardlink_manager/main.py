@@ -5,6 +5,8 @@ import sys
 import tkinter as tk
 from tkinter import messagebox
 
+__all__ = ["main"]
+
 
 def _fix_noconsole_streams():
     """Redirect stdio to devnull when running as a --noconsole exe.
@@ -33,6 +35,8 @@ def _install_exception_handler(root: tk.Tk):
 def main():
     _fix_noconsole_streams()
 
+    # Imported only once the streams are usable: under --noconsole any
+    # import-time warning (Tk, watchdog) would otherwise write to None
     from hardlink_manager.ui.app import HardlinkManagerApp
     app = HardlinkManagerApp()
     _install_exception_handler(app.root)
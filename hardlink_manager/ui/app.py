@@ -1,13 +1,22 @@
 """Main application window for the Hardlink Manager."""
 
+import bisect
 import os
 import platform
+import queue
 import shutil
+import stat
+import threading
 import tkinter as tk
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tkinter import ttk, filedialog, messagebox, simpledialog
+from typing import Optional
 
-from hardlink_manager.core.mirror_groups import MirrorGroupRegistry
+from hardlink_manager.core.hardlink_ops import build_inode_index, find_all_hardlinks
+from hardlink_manager.core.mirror_groups import MirrorGroup, MirrorGroupRegistry
 from hardlink_manager.core.sync import (
+    delete_files_from_group,
     delete_from_group,
     delete_symlink_from_group,
     sync_group,
@@ -18,22 +27,25 @@ from hardlink_manager.ui.file_browser import DirectoryTree, FileListPanel, Tabbe
 from hardlink_manager.ui.mirror_panel import MirrorGroupPanel
 from hardlink_manager.ui.search_panel import SearchPanel
 from hardlink_manager.ui.dialogs import (
+    ConfirmListDialog,
     CreateHardlinkDialog,
     CreateSymlinkDialog,
     DeleteHardlinkDialog,
+    ErrorListDialog,
+    ProgressDialog,
     RenameDialog,
     ViewHardlinksDialog,
     ViewMirrorsDialog,
     ViewSymlinkDialog,
+    _center_when_idle,
 )
 from hardlink_manager.utils.filesystem import (
     copy_item,
     delete_item,
     format_file_size,
-    get_hardlink_count,
-    get_inode,
     is_symlink,
     move_item,
+    norm_abspath,
     open_file,
     read_symlink_target,
     reveal_in_explorer,
@@ -41,6 +53,120 @@ from hardlink_manager.utils.filesystem import (
 )
 
 
+_SYSTEM = platform.system()
+"""Host operating system, looked up once at import."""
+
+
+def _same_dir(a: str, b: str) -> bool:
+    """Whether two paths name the same directory.
+
+    Compares identities, so symlinked, junctioned or differently cased
+    spellings of one folder match; falls back to comparing the paths as
+    strings if either cannot be stat'd.
+    """
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return os.path.normpath(a) == os.path.normpath(b)
+
+
+def _basename(path: str) -> str:
+    """Final component of *path*, for status and dialog text.
+
+    A lighter ``os.path.basename`` for the absolute paths the UI deals in:
+    one split at the last separator instead of a full drive/path parse.
+    """
+    if os.altsep:
+        path = path.replace(os.altsep, os.sep)
+    return path.rpartition(os.sep)[2]
+
+
+def _names_preview(paths: list[str], limit: int = 5) -> str:
+    """Comma-separated names of the first *limit* paths, noting the rest."""
+    names = ", ".join(_basename(p) for p in paths[:limit])
+    if len(paths) > limit:
+        names += f", \u2026 +{len(paths) - limit} more"
+    return names
+
+
+def _classify(path: str) -> str:
+    """Return what *path* itself is, from a single lstat.
+
+    One of ``"symlink"``, ``"dir"``, ``"file"``, ``"other"`` or
+    ``"missing"``.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
+        return "missing"
+    if stat.S_ISLNK(mode):
+        return "symlink"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "other"
+
+
+_SCANDIR_MIN_ITEMS = 16
+"""Selections this large from one folder are classified from a listing."""
+
+# How long watcher sync reports are collected before the status bar shows them
+_SYNC_STATUS_DELAY_MS = 150
+
+# Quiet time after mirror group edits before the watcher is updated
+_WATCHER_UPDATE_DELAY_MS = 300
+
+# Status-bar stat results kept for re-selected files
+_STAT_CACHE_SIZE = 256
+
+# Mirror group files handed to one delete_files_from_group call
+_DELETE_BATCH = 64
+
+# Past this many changed entries a full re-listing is cheaper than row edits
+_ROW_UPDATE_LIMIT = 200
+
+
+def _entry_kind(entry: os.DirEntry) -> str:
+    """Like :func:`_classify`, from a directory entry's cached type."""
+    if entry.is_symlink():
+        return "symlink"
+    if entry.is_dir(follow_symlinks=False):
+        return "dir"
+    if entry.is_file(follow_symlinks=False):
+        return "file"
+    return "other"
+
+
+def _classify_paths(paths: list[str]) -> list[str]:
+    """Return the :func:`_classify` result for each of *paths*.
+
+    Items are grouped by folder. Small groups are lstat'd one by one; for
+    large ones the folder is listed once and the entry types the listing
+    already carries are used instead.
+    """
+    by_parent: dict[str, list[int]] = {}
+    for i, path in enumerate(paths):
+        by_parent.setdefault(os.path.dirname(path), []).append(i)
+
+    kinds = [""] * len(paths)
+    for parent, indexes in by_parent.items():
+        entries: dict[str, os.DirEntry] = {}
+        if len(indexes) >= _SCANDIR_MIN_ITEMS:
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                pass
+        for i in indexes:
+            entry = entries.get(_basename(paths[i]))
+            try:
+                kinds[i] = _entry_kind(entry) if entry is not None else _classify(paths[i])
+            except OSError:
+                kinds[i] = _classify(paths[i])
+    return kinds
+
+
 class HardlinkManagerApp:
     """Main application for the Hardlink Manager."""
 
@@ -55,6 +181,36 @@ class HardlinkManagerApp:
 
         # Clipboard for copy/cut operations: (paths, mode) where mode is "copy" or "cut"
         self._clipboard: tuple[list[str], str] | None = None
+        self._paste_thread: threading.Thread | None = None
+        # Progress of the running paste, updated by its worker thread
+        self._paste_mode = "copy"
+        self._paste_count = 0
+        self._paste_total = 0
+        self._paste_errors: list[str] = []
+        self._paste_added: list[str] = []
+        self._delete_thread: threading.Thread | None = None
+
+        # Latest file selection waiting for its status-bar update
+        self._pending_select_path: str | None = None
+        self._pending_select_id: str | None = None
+        # Recent status-bar stats; dropped whenever the listing may be stale
+        self._stat_cache: OrderedDict[str, os.stat_result] = OrderedDict()
+        # Pending after_idle re-listing of the current directory
+        self._reload_id: str | None = None
+        # (generation, search dirs, index) of the last hardlink search; the
+        # generation is bumped whenever files may have changed. Watcher
+        # syncs are added in place instead, counted by _inode_index_patches
+        self._inode_index: tuple[int, tuple[str, ...], dict] | None = None
+        self._inode_index_gen = 0
+        self._inode_index_patches = 0
+        self._inode_index_lock = threading.Lock()
+        # Pending watcher update after mirror group edits
+        self._watcher_update_id: str | None = None
+
+        # Watcher sync reports waiting to be shown in the status bar
+        self._sync_events: deque[tuple[str, list[str]]] = deque()
+        self._sync_events_lock = threading.Lock()
+        self._sync_drain_scheduled = False
 
         # Mirror group registry and watcher
         self.registry = MirrorGroupRegistry()
@@ -96,22 +252,33 @@ class HardlinkManagerApp:
         edit_menu.add_command(label="Rename...", accelerator="F2", command=self._rename_action)
         edit_menu.add_command(label="Delete", accelerator="Del", command=self._delete_action)
 
-        # Actions menu
-        actions_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Actions", menu=actions_menu)
-        actions_menu.add_command(label="Open", command=self._open_file_action)
-        actions_menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
-        actions_menu.add_separator()
-        actions_menu.add_command(label="Create Hardlink...", command=self._create_hardlink_action)
-        actions_menu.add_command(label="View Hardlinks...", command=self._view_hardlinks_action)
-        actions_menu.add_separator()
-        actions_menu.add_command(label="Create Folder Symlink...", command=self._create_symlink_action)
-        actions_menu.add_command(label="View Symlink Details...", command=self._view_symlink_action)
-
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
+        # Actions and Help menus are filled when first opened
+        self._add_lazy_menu(menubar, "Actions", self._fill_actions_menu)
+        self._add_lazy_menu(menubar, "Help", self._fill_help_menu)
+
+    def _add_lazy_menu(self, menubar: tk.Menu, label: str, fill):
+        """Add a cascade whose entries are created the first time it posts."""
+        menu = tk.Menu(menubar, tearoff=0)
+
+        def fill_once():
+            menu.configure(postcommand="")
+            fill(menu)
+
+        menu.configure(postcommand=fill_once)
+        menubar.add_cascade(label=label, menu=menu)
+
+    def _fill_actions_menu(self, menu: tk.Menu):
+        menu.add_command(label="Open", command=self._open_file_action)
+        menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
+        menu.add_separator()
+        menu.add_command(label="Create Hardlink...", command=self._create_hardlink_action)
+        menu.add_command(label="View Hardlinks...", command=self._view_hardlinks_action)
+        menu.add_separator()
+        menu.add_command(label="Create Folder Symlink...", command=self._create_symlink_action)
+        menu.add_command(label="View Symlink Details...", command=self._view_symlink_action)
+
+    def _fill_help_menu(self, menu: tk.Menu):
+        menu.add_command(label="About", command=self._show_about)
 
     def _build_ui(self):
         # Main paned window: left (tree) | right (content)
@@ -146,6 +313,7 @@ class HardlinkManagerApp:
             on_file_open=self._open_file_action,
             on_dir_select=self._on_dir_select,
             on_dir_open=self._on_dir_open,
+            on_load_progress=self._on_load_progress,
         )
         self.file_list.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
 
@@ -173,71 +341,82 @@ class HardlinkManagerApp:
         main_pane.add(right_frame, weight=3)
 
         # -- Status bar --
-        self.status_var = tk.StringVar(value="Ready. Open a folder to begin.")
-        status_bar = ttk.Label(
+        # Written directly rather than through a StringVar, which adds a
+        # variable trace to every status update
+        self.status_bar_label = ttk.Label(
             self.root,
-            textvariable=self.status_var,
+            text="Ready. Open a folder to begin.",
             relief=tk.SUNKEN,
             padding=(5, 2),
         )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar_label.pack(side=tk.BOTTOM, fill=tk.X)
 
     def _build_context_menu(self):
-        # -- File context menu --
-        self.file_context_menu = tk.Menu(self.root, tearoff=0)
-        self.file_context_menu.add_command(label="Open", command=self._open_file_action)
-        self.file_context_menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
-        self.file_context_menu.add_separator()
-        self.file_context_menu.add_command(label="Copy", command=self._copy_action)
-        self.file_context_menu.add_command(label="Cut", command=self._cut_action)
-        self.file_context_menu.add_separator()
-        self.file_context_menu.add_command(label="Create Hardlink To...", command=self._create_hardlink_action)
-        self.file_context_menu.add_command(label="View Hardlinks", command=self._view_hardlinks_action)
-        self.file_context_menu.add_separator()
-        self.file_context_menu.add_command(label="Rename...", command=self._rename_action)
-        self.file_context_menu.add_command(label="Delete", command=self._delete_action)
-
-        # -- Folder context menu --
-        self.folder_context_menu = tk.Menu(self.root, tearoff=0)
-        self.folder_context_menu.add_command(label="Open Folder", command=self._open_selected_folder)
-        self.folder_context_menu.add_command(label="Open in New Tab", command=self._open_in_new_tab)
-        self.folder_context_menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
-        self.folder_context_menu.add_separator()
-        self.folder_context_menu.add_command(label="Copy", command=self._copy_action)
-        self.folder_context_menu.add_command(label="Cut", command=self._cut_action)
-        self.folder_context_menu.add_separator()
-        self.folder_context_menu.add_command(label="Create Hardlink Mirror...", command=self._create_mirror_from_folder)
-        self.folder_context_menu.add_command(label="Add to Existing Mirror...", command=self._add_folder_to_mirror)
-        self.folder_context_menu.add_command(label="View Hardlink Mirrors", command=self._view_mirrors_action)
-        self.folder_context_menu.add_separator()
-        self.folder_context_menu.add_command(label="Rename...", command=self._rename_action)
-        self.folder_context_menu.add_command(label="Delete", command=self._delete_action)
-
-        # -- Symlink context menu --
-        self.symlink_context_menu = tk.Menu(self.root, tearoff=0)
-        self.symlink_context_menu.add_command(label="Open Target Folder", command=self._open_symlink_target)
-        self.symlink_context_menu.add_command(label="Open in New Tab", command=self._open_in_new_tab)
-        self.symlink_context_menu.add_command(label="View Symlink Details", command=self._view_symlink_action)
-        self.symlink_context_menu.add_separator()
-        self.symlink_context_menu.add_command(label="Delete Symlink", command=self._delete_action)
-
-        # -- Background context menu (right-click on empty area) --
-        self.bg_context_menu = tk.Menu(self.root, tearoff=0)
-        self.bg_context_menu.add_command(label="Paste", command=self._paste_action)
-        self.bg_context_menu.add_separator()
-        self.bg_context_menu.add_command(label="Create Folder Symlink...", command=self._create_symlink_action)
+        # Menus are built on first use (see _context_menu); only the
+        # right-click bindings are installed up front.
+        self._context_menus: dict[str, tk.Menu] = {}
 
         # Bind right-click on all file list tabs
         self.file_list.bind_tree("<Button-3>", self._show_context_menu)
-        if platform.system() == "Darwin":
+        if _SYSTEM == "Darwin":
             self.file_list.bind_tree("<Button-2>", self._show_context_menu)
 
+    def _context_menu(self, kind: str) -> tk.Menu:
+        """Return the context menu for *kind*, building it the first time."""
+        menu = self._context_menus.get(kind)
+        if menu is None:
+            menu = tk.Menu(self.root, tearoff=0)
+            getattr(self, f"_fill_{kind}_context_menu")(menu)
+            self._context_menus[kind] = menu
+        return menu
+
+    def _fill_file_context_menu(self, menu: tk.Menu):
+        menu.add_command(label="Open", command=self._open_file_action)
+        menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
+        menu.add_separator()
+        menu.add_command(label="Copy", command=self._copy_action)
+        menu.add_command(label="Cut", command=self._cut_action)
+        menu.add_separator()
+        menu.add_command(label="Create Hardlink To...", command=self._create_hardlink_action)
+        menu.add_command(label="View Hardlinks", command=self._view_hardlinks_action)
+        menu.add_separator()
+        menu.add_command(label="Rename...", command=self._rename_action)
+        menu.add_command(label="Delete", command=self._delete_action)
+
+    def _fill_folder_context_menu(self, menu: tk.Menu):
+        menu.add_command(label="Open Folder", command=self._open_selected_folder)
+        menu.add_command(label="Open in New Tab", command=self._open_in_new_tab)
+        menu.add_command(label="Open in Explorer", command=self._open_in_explorer_action)
+        menu.add_separator()
+        menu.add_command(label="Copy", command=self._copy_action)
+        menu.add_command(label="Cut", command=self._cut_action)
+        menu.add_separator()
+        menu.add_command(label="Create Hardlink Mirror...", command=self._create_mirror_from_folder)
+        menu.add_command(label="Add to Existing Mirror...", command=self._add_folder_to_mirror)
+        menu.add_command(label="View Hardlink Mirrors", command=self._view_mirrors_action)
+        menu.add_separator()
+        menu.add_command(label="Rename...", command=self._rename_action)
+        menu.add_command(label="Delete", command=self._delete_action)
+
+    def _fill_symlink_context_menu(self, menu: tk.Menu):
+        menu.add_command(label="Open Target Folder", command=self._open_symlink_target)
+        menu.add_command(label="Open in New Tab", command=self._open_in_new_tab)
+        menu.add_command(label="View Symlink Details", command=self._view_symlink_action)
+        menu.add_separator()
+        menu.add_command(label="Delete Symlink", command=self._delete_action)
+
+    def _fill_bg_context_menu(self, menu: tk.Menu):
+        # Right-click on an empty area of the file list
+        menu.add_command(label="Paste", command=self._paste_action)
+        menu.add_separator()
+        menu.add_command(label="Create Folder Symlink...", command=self._create_symlink_action)
+
     def _bind_keyboard_shortcuts(self):
-        self.root.bind_all("<Control-c>", lambda e: self._copy_action())
-        self.root.bind_all("<Control-x>", lambda e: self._cut_action())
-        self.root.bind_all("<Control-v>", lambda e: self._paste_action())
-        self.root.bind_all("<Delete>", lambda e: self._delete_action())
-        self.root.bind_all("<F2>", lambda e: self._rename_action())
+        self.root.bind_all("<Control-c>", self._copy_action)
+        self.root.bind_all("<Control-x>", self._cut_action)
+        self.root.bind_all("<Control-v>", self._paste_action)
+        self.root.bind_all("<Delete>", self._delete_action)
+        self.root.bind_all("<F2>", self._rename_action)
 
     def _show_context_menu(self, event):
         tree = event.widget
@@ -248,55 +427,117 @@ class HardlinkManagerApp:
             if item not in tree.selection():
                 tree.selection_set(item)
             if self.file_list.is_selected_symlink():
-                self.symlink_context_menu.tk_popup(event.x_root, event.y_root)
+                self._context_menu("symlink").tk_popup(event.x_root, event.y_root)
             elif self.file_list.is_selected_dir():
-                self.folder_context_menu.tk_popup(event.x_root, event.y_root)
+                self._context_menu("folder").tk_popup(event.x_root, event.y_root)
             else:
-                self.file_context_menu.tk_popup(event.x_root, event.y_root)
+                self._context_menu("file").tk_popup(event.x_root, event.y_root)
         else:
             # Right-click on empty area — show paste/create-symlink menu
             if self.file_list.current_dir:
-                self.bg_context_menu.tk_popup(event.x_root, event.y_root)
+                self._context_menu("bg").tk_popup(event.x_root, event.y_root)
 
     # -- Watcher callbacks --
 
     def _on_watcher_sync(self, source: str, created: list[str]):
-        """Called from the watcher thread when files are auto-synced."""
-        n = len(created)
-        msg = f"Auto-synced: {os.path.basename(source)} -> {n} mirror(s)"
-        self.root.after(0, lambda: self._set_status(msg))
+        """Called from the watcher thread when files are auto-synced.
+
+        Bursts (e.g. unpacking an archive) are queued and reported by a
+        single status update per quiet window instead of one per file.
+        """
+        self._patch_inode_index(source, created)
+        with self._sync_events_lock:
+            self._sync_events.append((source, created))
+            if self._sync_drain_scheduled:
+                return
+            self._sync_drain_scheduled = True
+        self.root.after(_SYNC_STATUS_DELAY_MS, self._drain_sync_events)
+
+    def _drain_sync_events(self):
+        with self._sync_events_lock:
+            events = list(self._sync_events)
+            self._sync_events.clear()
+            self._sync_drain_scheduled = False
+        if events:
+            # The inode index was already patched by _on_watcher_sync
+            self._stat_cache.clear()
+            self._show_synced_rows(events)
+        if len(events) == 1:
+            source, created = events[0]
+            self._set_status(f"Auto-synced: {_basename(source)} -> {len(created)} mirror(s)")
+        elif events:
+            links = sum(len(created) for _source, created in events)
+            self._set_status(f"Auto-synced: {len(events)} items -> {links} link(s)")
+
+    def _show_synced_rows(self, events: list[tuple[str, list[str]]]):
+        """Refresh listed rows whose link count a watcher sync changed.
+
+        New links in the current directory are added, and existing rows
+        (with their cached stats) are re-read.
+        """
+        current = self.file_list.current_dir
+        if not current or self._reload_id is not None:
+            return
+        paths = {path for source, created in events for path in (source, *created)
+                 if os.path.dirname(path) == current}
+        if len(paths) > _ROW_UPDATE_LIMIT:
+            self._request_reload()
+            return
+        for path in sorted(paths):
+            self.file_list.add_row(path)
 
     def _on_mirror_groups_changed(self):
-        self._restart_watcher()
+        # Group edits can sync files, so cached link information may be stale
+        self._invalidate_file_caches()
+        # A burst of edits (e.g. adding several folders) updates the
+        # watcher once, after the edits settle
+        if self._watcher_update_id is not None:
+            self.root.after_cancel(self._watcher_update_id)
+        self._watcher_update_id = self.root.after(_WATCHER_UPDATE_DELAY_MS, self._restart_watcher)
 
     def _restart_watcher(self):
-        has_sync = any(g.sync_enabled for g in self.registry.get_all_groups())
-        if has_sync:
+        self._watcher_update_id = None
+        if self.registry.any_sync_enabled:
             self.watcher.refresh()
         else:
             self.watcher.stop()
 
     def _on_close(self):
+        if self._pending_select_id is not None:
+            self.root.after_cancel(self._pending_select_id)
+        if self._reload_id is not None:
+            self.root.after_cancel(self._reload_id)
+        if self._watcher_update_id is not None:
+            self.root.after_cancel(self._watcher_update_id)
         self.watcher.stop()
         self.root.destroy()
 
     # -- Folder navigation callbacks --
 
     def _on_dir_select(self, path: str):
-        self._set_status(f"Folder: {os.path.basename(path)}")
+        self._set_status(f"Folder: {_basename(path)}")
 
     def _on_dir_open(self, path: str):
+        self._stat_cache.clear()
         self._set_status(f"Viewing: {path}")
 
+    def _on_load_progress(self, remaining: int):
+        if remaining:
+            self._set_status(f"Loading: {remaining} rows\u2026")
+        else:
+            self._set_status(f"Viewing: {self.file_list.current_dir}")
+
     def _navigate_to_folder(self, path: str):
         """Navigate the file browser to a folder and switch to the File Browser tab."""
         self.notebook.select(0)  # Switch to File Browser tab
+        self._stat_cache.clear()
         self.file_list.load_directory(path)
         self._set_status(f"Viewing: {path}")
 
     def _open_selected_folder(self):
         path = self.file_list.get_selected_path()
         if path and os.path.isdir(path):
+            self._stat_cache.clear()
             self.file_list.load_directory(path)
             self._set_status(f"Viewing: {path}")
 
@@ -313,8 +554,7 @@ class HardlinkManagerApp:
         source = self.file_list.get_selected_path()
         if not source or not os.path.isdir(source):
             return
-        source = os.path.abspath(source)
-        source_name = os.path.basename(source)
+        source_name = _basename(source)
 
         # Ask for the mirror folder name (default = same as source)
         mirror_name = simpledialog.askstring(
@@ -363,16 +603,26 @@ class HardlinkManagerApp:
         except Exception as e:
             self._set_status(f"Mirror created at {dest} (sync error: {e})")
 
-        self.mirror_panel.refresh_list()
-        self._on_mirror_groups_changed()
-        if self.file_list.current_dir and os.path.normpath(self.file_list.current_dir) == os.path.normpath(dest_parent):
-            self.file_list.load_directory(self.file_list.current_dir)
+        self.watcher.add_group(group)
+        self._refresh_after_mutation(dirs=[dest_parent], registry_changed=True)
+
+    def _refresh_after_mutation(self, dirs=(), registry_changed: bool = False):
+        """Bring the views up to date after an action changed folders or groups.
+
+        The mirror group list is redrawn once if the registry changed, and
+        the file list is re-read once if it shows any of *dirs*. The watcher
+        is updated by the caller, which knows exactly what was added.
+        """
+        if registry_changed:
+            self.mirror_panel.refresh_list()
+        current = self.file_list.current_dir
+        if current and any(_same_dir(d, current) for d in dirs):
+            self._request_reload()
 
     def _add_folder_to_mirror(self):
         path = self.file_list.get_selected_path()
         if not path or not os.path.isdir(path):
             return
-        path = os.path.abspath(path)
 
         existing = self.registry.find_group_for_folder(path)
         if existing:
@@ -392,34 +642,34 @@ class HardlinkManagerApp:
             )
             return
 
-        dlg = _GroupPickerDialog(self.root, groups)
+        dlg = _GroupPickerDialog(self.root, groups, self.registry)
         self.root.wait_window(dlg)
         if dlg.selected_group_id:
             self.registry.add_folder_to_group(dlg.selected_group_id, path)
             group = self.registry.get_group(dlg.selected_group_id)
             self._set_status(f"Added folder to mirror: {group.name}")
-            self.mirror_panel.refresh_list()
-            self._on_mirror_groups_changed()
+            self.watcher.add_folder(group, path)
+            self._refresh_after_mutation(registry_changed=True)
 
     # -- Clipboard operations --
 
-    def _copy_action(self):
+    def _copy_action(self, event=None):
         selected = self.file_list.get_selected_paths()
         if not selected:
             return
         self._clipboard = (selected, "copy")
-        names = ", ".join(os.path.basename(p) for p in selected)
+        names = _names_preview(selected)
         self._set_status(f"Copied {len(selected)} item(s): {names}")
 
-    def _cut_action(self):
+    def _cut_action(self, event=None):
         selected = self.file_list.get_selected_paths()
         if not selected:
             return
         self._clipboard = (selected, "cut")
-        names = ", ".join(os.path.basename(p) for p in selected)
+        names = _names_preview(selected)
         self._set_status(f"Cut {len(selected)} item(s): {names}")
 
-    def _paste_action(self):
+    def _paste_action(self, event=None):
         if not self._clipboard:
             self._set_status("Nothing to paste.")
             return
@@ -427,32 +677,104 @@ class HardlinkManagerApp:
             self._set_status("Open a folder first.")
             return
 
+        if self._paste_thread is not None:
+            self._set_status("A paste is already in progress.")
+            return
+
         sources, mode = self._clipboard
         dest_dir = self.file_list.current_dir
-        pasted = 0
-        errors = []
-
-        for src in sources:
+        transfer = copy_item if mode == "copy" else move_item
+        self._paste_mode = mode
+        self._paste_count = 0
+        self._paste_total = len(sources)
+        self._paste_errors = []
+        self._paste_added = []
+
+        def _paste_one(src: str):
             if not os.path.exists(src):
-                continue
-            try:
-                if mode == "copy":
-                    copy_item(src, dest_dir)
+                return None
+            return transfer(src, dest_dir)
+
+        def _worker():
+            # Sources sharing a name would race for the same destination;
+            # like a serial paste, only the first of them gets through.
+            seen_names = set()
+            unique = []
+            for src in sources:
+                name = _basename(src)
+                if name in seen_names:
+                    self._paste_errors.append(f"'{name}' already exists in the destination.")
                 else:
-                    move_item(src, dest_dir)
-                pasted += 1
-            except (FileExistsError, OSError) as e:
-                errors.append(str(e))
+                    seen_names.add(name)
+                    unique.append(src)
+            if not unique:
+                return
+            with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+                futures = [pool.submit(_paste_one, src) for src in unique]
+                for future in as_completed(futures):
+                    try:
+                        dest = future.result()
+                        if dest:
+                            self._paste_added.append(dest)
+                            self._paste_count += 1
+                    except Exception as e:
+                        self._paste_errors.append(str(e))
+
+        self._set_status(f"Pasting {len(sources)} item(s)...")
+        self._paste_thread = threading.Thread(target=_worker, daemon=True)
+        self._paste_thread.start()
+        self._poll_paste()
+
+    def _poll_paste(self):
+        """Check whether the background paste thread has finished."""
+        verb = "Copied" if self._paste_mode == "copy" else "Moved"
+        if self._paste_thread is not None and self._paste_thread.is_alive():
+            self._set_status(f"{verb} {self._paste_count} of {self._paste_total} item(s)...")
+            self.root.after(100, self._poll_paste)
+            return
+        self._paste_thread = None
 
-        if mode == "cut":
+        if self._paste_mode == "cut":
             self._clipboard = None
 
-        if errors:
-            messagebox.showerror("Paste Error", "\n".join(errors), parent=self.root)
-        if pasted:
-            verb = "Copied" if mode == "copy" else "Moved"
-            self._set_status(f"{verb} {pasted} item(s).")
-        self.file_list.load_directory(self.file_list.current_dir)
+        if self._paste_errors:
+            ErrorListDialog(self.root, "Paste Error",
+                            f"{len(self._paste_errors)} item(s) could not be pasted:",
+                            self._paste_errors)
+        if self._paste_count:
+            self._set_status(f"{verb} {self._paste_count} item(s).")
+            # Let the status message paint before the listing is updated
+            self.root.after_idle(self._apply_row_changes, (), self._paste_added)
+
+    def _request_reload(self):
+        """Re-list the current directory once the event loop is idle.
+
+        Several requests made while one is pending share a single scan.
+        """
+        if self._reload_id is None:
+            self._reload_id = self.root.after_idle(self._do_reload)
+
+    def _do_reload(self):
+        self._reload_id = None
+        self._invalidate_file_caches()
+        if self.file_list.current_dir:
+            self.file_list.load_directory(self.file_list.current_dir)
+
+    def _apply_row_changes(self, removed=(), added=()):
+        """Patch the file listing after the app itself changed some entries.
+
+        Only the affected rows are touched; large batches fall back to a
+        full re-listing of the current directory.
+        """
+        if not self.file_list.current_dir or self._reload_id is not None:
+            return  # A pending full reload will show the changes anyway
+        self._invalidate_file_caches()
+        if len(removed) + len(added) > _ROW_UPDATE_LIMIT:
+            self._request_reload()
+            return
+        self.file_list.remove_rows(list(removed))
+        for path in added:
+            self.file_list.add_row(path)
 
     # -- File/folder menu actions --
 
@@ -474,22 +796,102 @@ class HardlinkManagerApp:
             self._set_status(f"Added: {d}")
 
     def _on_tree_select(self, path: str):
+        self._stat_cache.clear()
         self.file_list.load_directory(path)
         self._set_status(f"Viewing: {path}")
 
     def _on_file_select(self, path: str):
+        # Holding an arrow key selects every row in turn; only stat the one
+        # the selection settles on.
+        self._pending_select_path = path
+        if self._pending_select_id is None:
+            self._pending_select_id = self.root.after(40, self._flush_file_select)
+
+    def _flush_file_select(self):
+        self._pending_select_id = None
+        path = self._pending_select_path
+        if path is None:
+            return
+        self._pending_select_path = None
         try:
-            size = os.path.getsize(path)
-            nlinks = get_hardlink_count(path)
-            inode = get_inode(path)
+            st = self._cached_stat(path)
             self._set_status(
-                f"{os.path.basename(path)}  |  "
-                f"Size: {format_file_size(size)}  |  "
-                f"Links: {nlinks}  |  "
-                f"Inode: {inode}"
+                f"{_basename(path)}  |  "
+                f"Size: {format_file_size(st.st_size)}  |  "
+                f"Links: {st.st_nlink}  |  "
+                f"Inode: {st.st_ino}"
             )
         except OSError:
-            self._set_status(os.path.basename(path))
+            self._set_status(_basename(path))
+
+    def _cached_stat(self, path: str) -> os.stat_result:
+        """One ``os.stat`` for size, link count and inode, reused on re-select.
+
+        Rows listed by the file browser already carry the stat taken while
+        scanning the directory, so those are never stat'd again.
+        """
+        st = self._stat_cache.get(path)
+        if st is not None:
+            self._stat_cache.move_to_end(path)
+            return st
+        st = self.file_list.cached_stat(path)
+        if st is not None:
+            return st
+        st = os.stat(path)
+        self._stat_cache[path] = st
+        if len(self._stat_cache) > _STAT_CACHE_SIZE:
+            self._stat_cache.popitem(last=False)
+        return st
+
+    def _invalidate_file_caches(self):
+        """Forget cached file metadata after files may have changed."""
+        self._stat_cache.clear()
+        self._inode_index_gen += 1
+
+    def _find_links(self, file_path: str, search_dirs: list[str]) -> list[str]:
+        """Hardlink lookup for the link dialogs; runs on their worker thread.
+
+        The search dirs are walked into an inode index once, and later
+        lookups in the same dirs reuse it until files change.
+        """
+        dirs = tuple(search_dirs)
+        gen = self._inode_index_gen
+        patches = self._inode_index_patches
+        cached = self._inode_index
+        if cached is not None and cached[0] == gen and cached[1] == dirs:
+            index = cached[2]
+        else:
+            index = build_inode_index(search_dirs)
+            with self._inode_index_lock:
+                # A sync reported mid-walk may be missing from this index,
+                # so only keep it if none came in
+                if self._inode_index_patches == patches:
+                    self._inode_index = (gen, dirs, index)
+        with self._inode_index_lock:
+            return find_all_hardlinks(file_path, search_dirs, index=index)
+
+    def _patch_inode_index(self, source: str, created: list[str]):
+        """Add the links the watcher just made to the cached inode index.
+
+        Runs on the watcher thread. Removed files need no patching, since
+        lookups re-check every indexed path.
+        """
+        with self._inode_index_lock:
+            self._inode_index_patches += 1
+            cached = self._inode_index
+            if cached is None or cached[0] != self._inode_index_gen:
+                return
+            _gen, dirs, index = cached
+            try:
+                st = os.stat(source)
+            except OSError:
+                return
+            roots = [os.path.join(os.path.normpath(os.path.abspath(d)), "") for d in dirs]
+            paths = index.setdefault((st.st_dev, st.st_ino), [])
+            for path in (source, *created):
+                path = os.path.normpath(path)
+                if path not in paths and any(path.startswith(r) for r in roots):
+                    bisect.insort(paths, path)
 
     def _open_file_action(self, path: str = None):
         selected = path or self.file_list.get_selected_file()
@@ -498,7 +900,7 @@ class HardlinkManagerApp:
             return
         try:
             open_file(selected)
-            self._set_status(f"Opened: {os.path.basename(selected)}")
+            self._set_status(f"Opened: {_basename(selected)}")
         except Exception as e:
             messagebox.showerror("Error Opening File", str(e), parent=self.root)
 
@@ -509,11 +911,11 @@ class HardlinkManagerApp:
             return
         try:
             reveal_in_explorer(selected)
-            self._set_status(f"Opened in Explorer: {os.path.basename(selected)}")
+            self._set_status(f"Opened in Explorer: {_basename(selected)}")
         except Exception as e:
             messagebox.showerror("Error", str(e), parent=self.root)
 
-    def _rename_action(self):
+    def _rename_action(self, event=None):
         selected = self.file_list.get_selected_path()
         if not selected:
             messagebox.showinfo("No Selection", "Please select a file or folder first.", parent=self.root)
@@ -521,9 +923,8 @@ class HardlinkManagerApp:
         dlg = RenameDialog(self.root, selected)
         self.root.wait_window(dlg)
         if dlg.new_path:
-            self._set_status(f"Renamed to: {os.path.basename(dlg.new_path)}")
-            if self.file_list.current_dir:
-                self.file_list.load_directory(self.file_list.current_dir)
+            self._set_status(f"Renamed to: {_basename(dlg.new_path)}")
+            self._apply_row_changes([selected], [dlg.new_path])
 
     def _create_hardlink_action(self):
         selected = self.file_list.get_selected_file()
@@ -534,21 +935,36 @@ class HardlinkManagerApp:
         self.root.wait_window(dlg)
         if dlg.result:
             self._set_status(f"Hardlink created: {dlg.result}")
-            if self.file_list.current_dir:
-                dest_dir = os.path.dirname(dlg.result)
-                if os.path.normpath(dest_dir) == os.path.normpath(self.file_list.current_dir):
-                    self.file_list.load_directory(self.file_list.current_dir)
+            # The source row's link count changed wherever the link went
+            self._invalidate_file_caches()
+            self.file_list.update_row(selected)
+            current = self.file_list.current_dir
+            if current and _same_dir(os.path.dirname(dlg.result), current):
+                self._apply_row_changes(added=[os.path.join(current, _basename(dlg.result))])
 
     def _view_hardlinks_action(self):
         selected = self.file_list.get_selected_file()
         if not selected:
             messagebox.showinfo("No File Selected", "Please select a file first.", parent=self.root)
             return
+        try:
+            nlinks = os.stat(selected).st_nlink
+        except OSError:
+            nlinks = 0
+        if nlinks == 1:
+            messagebox.showinfo(
+                "No Other Hardlinks",
+                f"'{_basename(selected)}' has a link count of 1; "
+                "it exists in only one location.",
+                parent=self.root,
+            )
+            return
         search_dirs = self._root_dirs if self._root_dirs else [os.path.dirname(selected)]
         try:
             dlg = ViewHardlinksDialog(
                 self.root, selected, search_dirs,
                 on_navigate=self._navigate_to_folder,
+                find_links=self._find_links,
             )
             dlg.wait_window()
         except Exception as e:
@@ -566,7 +982,7 @@ class HardlinkManagerApp:
         if not group:
             messagebox.showinfo(
                 "Not Mirrored",
-                f"'{os.path.basename(selected)}' is not part of any mirror group.",
+                f"'{_basename(selected)}' is not part of any mirror group.",
                 parent=self.root,
             )
             return
@@ -588,19 +1004,17 @@ class HardlinkManagerApp:
         if dlg.result:
             self._set_status(f"Symlink created: {dlg.result}")
             # If the current dir is in a mirror group, sync the new symlink
-            result = self.registry.find_group_for_path(dlg.result)
-            if result:
-                group, _root = result
-                if group.sync_enabled:
-                    try:
-                        synced = sync_symlink_to_group(dlg.result, group)
-                        if synced:
-                            self._set_status(
-                                f"Symlink created and synced to {len(synced)} mirror(s)"
-                            )
-                    except Exception:
-                        pass
-            self.file_list.load_directory(self.file_list.current_dir)
+            group = self.registry.find_group_only(dlg.result)
+            if group is not None and group.sync_enabled:
+                try:
+                    synced = sync_symlink_to_group(dlg.result, group)
+                    if synced:
+                        self._set_status(
+                            f"Symlink created and synced to {len(synced)} mirror(s)"
+                        )
+                except Exception:
+                    pass
+            self._apply_row_changes(added=[dlg.result])
 
     def _view_symlink_action(self):
         """Show details of the selected symlink."""
@@ -632,26 +1046,38 @@ class HardlinkManagerApp:
         except OSError as e:
             messagebox.showerror("Error", str(e), parent=self.root)
 
-    def _delete_action(self):
+    def _delete_action(self, event=None):
         """Delete the selected file(s) or folder(s)."""
         selected_paths = self.file_list.get_selected_paths()
         if not selected_paths:
             messagebox.showinfo("No Selection", "Please select a file or folder first.", parent=self.root)
             return
 
-        # Single item: use detailed dialogs (mirror-group aware, hardlink info)
-        if len(selected_paths) == 1:
-            self._delete_single(selected_paths[0])
-        else:
-            self._delete_multiple(selected_paths)
+        if self._delete_thread is not None:
+            self._set_status("A delete is already in progress.")
+            return
 
-        if self.file_list.current_dir:
-            self.file_list.load_directory(self.file_list.current_dir)
+        kinds = _classify_paths(selected_paths)
+        if len(selected_paths) > 1:
+            # Runs in the background and reloads the listing when done
+            self._delete_multiple(selected_paths, kinds)
+            return
 
-    def _delete_single(self, selected: str):
-        """Delete a single file, folder, or symlink with detailed confirmation."""
-        if os.path.islink(selected):
-            name = os.path.basename(selected)
+        # Single item: use detailed dialogs (mirror-group aware, hardlink info)
+        selected = selected_paths[0]
+        self._delete_single(selected, kinds[0])
+        # Drop the row if the item is gone, and refresh the other listed
+        # names of the file, whose link counts (or existence) may have changed
+        self._invalidate_file_caches()
+        self.file_list.update_linked_rows(selected)
+
+    def _delete_single(self, selected: str, kind: str):
+        """Delete a single file, folder, or symlink with detailed confirmation.
+
+        *kind* is the item's :func:`_classify` result.
+        """
+        if kind == "symlink":
+            name = _basename(selected)
             try:
                 target = read_symlink_target(selected)
             except OSError:
@@ -665,9 +1091,8 @@ class HardlinkManagerApp:
             ):
                 return
             # If in a mirror group, delete from all folders
-            result = self.registry.find_group_for_path(selected)
-            if result:
-                group, _root = result
+            group = self.registry.find_group_only(selected)
+            if group is not None:
                 try:
                     deleted = delete_symlink_from_group(selected, group)
                     self._set_status(f"Symlink removed from {len(deleted)} folder(s).")
@@ -680,8 +1105,8 @@ class HardlinkManagerApp:
                 except Exception as e:
                     messagebox.showerror("Error", str(e), parent=self.root)
             return
-        if os.path.isdir(selected):
-            name = os.path.basename(selected)
+        if kind == "dir":
+            name = _basename(selected)
             if not messagebox.askyesno(
                 "Delete Folder",
                 f"Delete folder '{name}' and all its contents?\n\n"
@@ -696,8 +1121,7 @@ class HardlinkManagerApp:
             except Exception as e:
                 messagebox.showerror("Error", str(e), parent=self.root)
         else:
-            result = self.registry.find_group_for_path(selected)
-            group = result[0] if result else None
+            group = self.registry.find_group_only(selected)
 
             if group is not None:
                 folder_list = "\n".join(f"  - {f}" for f in group.folders)
@@ -712,55 +1136,137 @@ class HardlinkManagerApp:
                         messagebox.showerror("Error", str(e), parent=self.root)
             else:
                 search_dirs = self._root_dirs if self._root_dirs else [os.path.dirname(selected)]
-                dlg = DeleteHardlinkDialog(self.root, selected, search_dirs)
+                dlg = DeleteHardlinkDialog(self.root, selected, search_dirs,
+                                           find_links=self._find_links)
                 self.root.wait_window(dlg)
                 if dlg.deleted:
                     self._set_status(f"Deleted: {selected}")
 
-    def _delete_multiple(self, paths: list[str]):
-        """Delete multiple selected items with a single confirmation."""
-        names = "\n".join(f"  - {os.path.basename(p)}" for p in paths[:10])
-        if len(paths) > 10:
-            names += f"\n  ... and {len(paths) - 10} more"
-        if not messagebox.askyesno(
-            "Delete Items",
-            f"Delete {len(paths)} selected item(s)?\n\n{names}\n\n"
-            "This cannot be undone.",
-            parent=self.root,
-        ):
+    def _delete_multiple(self, paths: list[str], kinds: list[str]):
+        """Delete multiple selected items with a single confirmation.
+
+        *kinds* holds the :func:`_classify` result for each path. The items
+        are deleted by a worker thread while a progress dialog is shown.
+        """
+        dlg = ConfirmListDialog(
+            self.root, "Delete Items",
+            f"Delete {len(paths)} selected item(s)?",
+            [_basename(p) for p in paths],
+            detail="This cannot be undone.",
+        )
+        self.root.wait_window(dlg)
+        if not dlg.confirmed:
             return
 
-        deleted_count = 0
-        errors = []
-        for path in paths:
+        progress = ProgressDialog(self.root, "Deleting", len(paths))
+        results: queue.Queue = queue.Queue()
+        self._delete_thread = threading.Thread(
+            target=self._delete_worker, args=(paths, kinds, results, progress.cancelled),
+            daemon=True)
+        self._delete_thread.start()
+        self._poll_delete_queue(results, progress, len(paths), 0, [], [])
+
+    def _delete_worker(self, paths: list[str], kinds: list[str], results: queue.Queue,
+                       cancelled: threading.Event):
+        """Delete *paths* off the Tk thread, posting one message per item.
+
+        A final ``("finished", None, None)`` message follows the last item,
+        or the item or batch being deleted when *cancelled* was set. Mirror
+        group membership is decided by an item's folder, so it is looked up
+        once per parent directory; mirrored files go last, a batch at a time.
+        """
+        groups: dict[str, Optional[MirrorGroup]] = {}
+        # Files inside a mirror group are deleted in batches per group
+        batched: dict[str, tuple[MirrorGroup, list[str]]] = {}
+        for path, kind in zip(paths, kinds):
+            if cancelled.is_set():
+                break
             try:
-                if os.path.islink(path):
-                    # Symlink: delete from mirror group or just unlink
-                    result = self.registry.find_group_for_path(path)
-                    if result:
-                        delete_symlink_from_group(path, result[0])
-                    else:
-                        os.unlink(path)
-                    deleted_count += 1
+                group = None
+                if kind in ("symlink", "file"):
+                    parent = os.path.dirname(path)
+                    if parent not in groups:
+                        groups[parent] = self.registry.find_group_only(parent)
+                    group = groups[parent]
+                if kind == "file" and group is not None:
+                    batched.setdefault(group.id, (group, []))[1].append(path)
                     continue
-                # Check mirror group membership for files
-                if os.path.isfile(path):
-                    result = self.registry.find_group_for_path(path)
-                    if result:
-                        delete_from_group(path, result[0])
-                        deleted_count += 1
-                        continue
-                delete_item(path)
-                deleted_count += 1
+                self._delete_one(path, kind, group)
+                results.put(("done", path, None))
             except Exception as e:
-                errors.append(f"{os.path.basename(path)}: {e}")
+                results.put(("error", path, e))
+
+        for group, group_paths in batched.values():
+            for start in range(0, len(group_paths), _DELETE_BATCH):
+                if cancelled.is_set():
+                    break
+                chunk = group_paths[start:start + _DELETE_BATCH]
+                try:
+                    result = delete_files_from_group(chunk, group)
+                except Exception as e:
+                    for path in chunk:
+                        results.put(("error", path, e))
+                    continue
+                # Failed unlinks are skipped by the group delete, so only
+                # report the paths whose own copy is actually gone
+                unlinked = {gone for deleted in result.values() for gone in deleted}
+                for path in chunk:
+                    if norm_abspath(path) in unlinked:
+                        results.put(("done", path, None))
+                    else:
+                        results.put(("error", path, OSError("could not be deleted")))
+        results.put(("finished", None, None))
+
+    def _delete_one(self, path: str, kind: str, group: Optional[MirrorGroup]):
+        """Delete one item of a multi-selection, other than a mirrored file."""
+        if kind == "symlink":
+            # Symlink: delete from mirror group or just unlink
+            if group is not None:
+                delete_symlink_from_group(path, group)
+            else:
+                os.unlink(path)
+            return
+        delete_item(path)
+
+    def _poll_delete_queue(self, results: queue.Queue, progress: ProgressDialog,
+                           total: int, done: int, errors: list[str], deleted: list[str]):
+        """Drain worker messages into the progress dialog until it finishes."""
+        finished = False
+        while not finished:
+            try:
+                status, path, exc = results.get_nowait()
+            except queue.Empty:
+                break
+            if status == "finished":
+                finished = True
+                continue
+            done += 1
+            if status == "error":
+                errors.append(f"{_basename(path)}: {exc}")
+            else:
+                deleted.append(path)
+            if not progress.cancelled.is_set():
+                progress.update_progress(done, f"Deleted {done} of {total}: {_basename(path)}")
+        if not finished:
+            self.root.after(50, self._poll_delete_queue, results, progress, total, done,
+                            errors, deleted)
+            return
+
+        cancelled = progress.cancelled.is_set()
+        progress.destroy()
+        self._delete_thread = None
         if errors:
-            messagebox.showerror("Delete Errors", "\n".join(errors), parent=self.root)
-        self._set_status(f"Deleted {deleted_count} item(s).")
+            ErrorListDialog(self.root, "Delete Errors",
+                            f"{len(errors)} item(s) could not be deleted:", errors)
+        if cancelled:
+            self._set_status(f"Delete cancelled after {len(deleted)} of {total} item(s).")
+        else:
+            self._set_status(f"Deleted {len(deleted)} item(s).")
+        self._apply_row_changes(removed=deleted)
 
     def _show_about(self):
         watcher_status = "running" if self.watcher.is_running else "stopped"
-        n_groups = len(self.registry.get_all_groups())
+        n_groups = self.registry.group_count
         messagebox.showinfo(
             "About Hardlink Manager",
             "Hardlink Manager v0.2.0\n\n"
@@ -771,7 +1277,7 @@ class HardlinkManagerApp:
         )
 
     def _set_status(self, msg: str):
-        self.status_var.set(msg)
+        self.status_bar_label.configure(text=msg)
 
     def run(self):
         self.root.mainloop()
@@ -780,7 +1286,7 @@ class HardlinkManagerApp:
 class _GroupPickerDialog(tk.Toplevel):
     """Simple dialog for picking an existing mirror group."""
 
-    def __init__(self, parent, groups: list):
+    def __init__(self, parent, groups: list, registry: MirrorGroupRegistry):
         super().__init__(parent)
         self.title("Select Mirror Group")
         self.selected_group_id = None
@@ -802,10 +1308,11 @@ class _GroupPickerDialog(tk.Toplevel):
         self._listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self._group_ids = []
-        for g in groups:
-            self._listbox.insert(tk.END, g.auto_name())
-            self._group_ids.append(g.id)
+        # One insert call for all rows instead of one Tcl command per group
+        self._group_ids = [g.id for g in groups]
+        names = [registry.group_display_name(g) for g in groups]
+        for start in range(0, len(names), 10_000):
+            self._listbox.insert(tk.END, *names[start:start + 10_000])
 
         self._listbox.bind("<Double-1>", lambda e: self._on_ok())
 
@@ -814,12 +1321,7 @@ class _GroupPickerDialog(tk.Toplevel):
         ttk.Button(btn_frame, text="OK", width=10, command=self._on_ok).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", width=10, command=self.destroy).pack(side=tk.LEFT, padx=5)
 
-        # Center on parent
-        self.update_idletasks()
-        pw, ph = parent.winfo_width(), parent.winfo_height()
-        px, py = parent.winfo_rootx(), parent.winfo_rooty()
-        w, h = self.winfo_width(), self.winfo_height()
-        self.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        _center_when_idle(self, parent)
 
     def _on_ok(self):
         sel = self._listbox.curselection()
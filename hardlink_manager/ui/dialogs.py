@@ -1,6 +1,7 @@
 """Dialog windows for hardlink and symlink operations."""
 
 import os
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Callable, Optional
@@ -21,6 +22,36 @@ from hardlink_manager.utils.filesystem import (
 )
 
 
+def _find_hardlinks_async(widget: tk.Misc, file_path: str, search_dirs: list[str],
+                          on_done: Callable[[list[str], Optional[Exception]], None],
+                          find_links: Callable[[str, list[str]], list[str]] = find_all_hardlinks):
+    """Run *find_links* (by default :func:`find_all_hardlinks`) on a worker thread.
+
+    ``on_done(links, error)`` is called on the Tk thread once the search
+    finishes, unless *widget* has been destroyed by then.
+    """
+    result: dict = {}
+
+    def _worker():
+        try:
+            result["links"] = find_links(file_path, search_dirs)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=_worker, daemon=True)
+    thread.start()
+
+    def _poll():
+        if not widget.winfo_exists():
+            return
+        if thread.is_alive():
+            widget.after(100, _poll)
+            return
+        on_done(result.get("links", []), result.get("error"))
+
+    widget.after(100, _poll)
+
+
 class CreateHardlinkDialog(tk.Toplevel):
     """Dialog for creating a hardlink to a file."""
 
@@ -105,12 +136,14 @@ class ViewHardlinksDialog(tk.Toplevel):
     """Dialog showing all hardlinks to a given file."""
 
     def __init__(self, parent, file_path: str, search_dirs: list[str],
-                 on_navigate: Optional[Callable[[str], None]] = None):
+                 on_navigate: Optional[Callable[[str], None]] = None,
+                 find_links: Callable[[str, list[str]], list[str]] = find_all_hardlinks):
         super().__init__(parent)
         self.title("View Hardlinks")
         self.file_path = file_path
         self.search_dirs = search_dirs
         self.on_navigate = on_navigate
+        self.find_links = find_links
         self._link_paths: list[str] = []
         self.transient(parent)
         self.grab_set()
@@ -169,17 +202,10 @@ class ViewHardlinksDialog(tk.Toplevel):
         self.listbox.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.listbox.yview)
 
-        # Populate
-        try:
-            links = find_all_hardlinks(self.file_path, self.search_dirs)
-            if links:
-                for link in links:
-                    self.listbox.insert(tk.END, link)
-                    self._link_paths.append(link)
-            else:
-                self.listbox.insert(tk.END, "(No additional hardlinks found in searched directories)")
-        except Exception as e:
-            self.listbox.insert(tk.END, f"Error: {e}")
+        # Populate once the search dirs have been walked in the background
+        self.listbox.insert(tk.END, "Searching\u2026")
+        _find_hardlinks_async(self, self.file_path, self.search_dirs, self._show_links,
+                              self.find_links)
 
         # Double-click to navigate
         if self.on_navigate:
@@ -188,6 +214,16 @@ class ViewHardlinksDialog(tk.Toplevel):
         # Close button
         ttk.Button(frame, text="Close", command=self.destroy).pack(pady=(10, 0))
 
+    def _show_links(self, links: list[str], error: Optional[Exception]):
+        self.listbox.delete(0, tk.END)
+        if error is not None:
+            self.listbox.insert(tk.END, f"Error: {error}")
+        elif links:
+            self.listbox.insert(tk.END, *links)
+            self._link_paths.extend(links)
+        else:
+            self.listbox.insert(tk.END, "(No additional hardlinks found in searched directories)")
+
     def _on_double_click(self, event):
         sel = self.listbox.curselection()
         if not sel or not self.on_navigate:
@@ -205,11 +241,13 @@ class ViewHardlinksDialog(tk.Toplevel):
 class DeleteHardlinkDialog(tk.Toplevel):
     """Confirmation dialog for deleting a hardlink."""
 
-    def __init__(self, parent, file_path: str, search_dirs: list[str]):
+    def __init__(self, parent, file_path: str, search_dirs: list[str],
+                 find_links: Callable[[str, list[str]], list[str]] = find_all_hardlinks):
         super().__init__(parent)
         self.title("Delete File")
         self.file_path = file_path
         self.search_dirs = search_dirs
+        self.find_links = find_links
         self.deleted = False
         self.transient(parent)
         self.grab_set()
@@ -239,21 +277,15 @@ class DeleteHardlinkDialog(tk.Toplevel):
 
         try:
             nlinks = get_hardlink_count(self.file_path)
-            links = find_all_hardlinks(self.file_path, self.search_dirs)
         except OSError:
             nlinks = 1
-            links = [self.file_path]
 
         ttk.Label(frame, text=f"Delete: {os.path.basename(self.file_path)}",
                   font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(frame, text=f"Path: {self.file_path}", wraplength=450).pack(anchor=tk.W)
 
         if nlinks > 1:
-            # File exists in multiple locations — show them all
-            other_links = [lnk for lnk in links
-                           if os.path.normpath(lnk) != os.path.normpath(self.file_path)]
-            folder_names = [os.path.dirname(lnk) for lnk in other_links]
-
+            # File exists in multiple locations — list them once found
             ttk.Label(
                 frame,
                 text=f"\nThis file also exists in:",
@@ -263,11 +295,13 @@ class DeleteHardlinkDialog(tk.Toplevel):
             list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
             scrollbar = ttk.Scrollbar(list_frame)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, height=5)
-            listbox.pack(fill=tk.BOTH, expand=True)
-            scrollbar.config(command=listbox.yview)
-            for lnk in other_links:
-                listbox.insert(tk.END, lnk)
+            self._listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, height=5)
+            self._listbox.pack(fill=tk.BOTH, expand=True)
+            scrollbar.config(command=self._listbox.yview)
+            self._listbox.insert(tk.END, "Searching\u2026")
+            # Only a file with other names needs the search dirs walked
+            _find_hardlinks_async(self, self.file_path, self.search_dirs, self._show_links,
+                                  self.find_links)
 
             ttk.Label(
                 frame,
@@ -287,6 +321,18 @@ class DeleteHardlinkDialog(tk.Toplevel):
         ttk.Button(btn_frame, text="Yes", width=8, command=self._on_yes).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="No", width=8, command=self.destroy).pack(side=tk.LEFT, padx=5)
 
+    def _show_links(self, links: list[str], error: Optional[Exception]):
+        self._listbox.delete(0, tk.END)
+        if error is not None:
+            self._listbox.insert(tk.END, f"Error: {error}")
+            return
+        own = os.path.normpath(self.file_path)
+        other_links = [lnk for lnk in links if os.path.normpath(lnk) != own]
+        if other_links:
+            self._listbox.insert(tk.END, *other_links)
+        else:
+            self._listbox.insert(tk.END, "(Other links are outside the searched directories)")
+
     def _on_yes(self):
         try:
             delete_hardlink(self.file_path)
@@ -598,3 +644,146 @@ class ViewSymlinkDialog(tk.Toplevel):
         if self.on_navigate and os.path.isdir(target):
             self.destroy()
             self.on_navigate(target)
+
+
+def _center_when_idle(dialog: tk.Toplevel, parent: tk.Misc):
+    """Center *dialog* over *parent* once Tk has laid it out.
+
+    Deferring to an idle callback avoids forcing a synchronous layout pass
+    with ``update_idletasks()`` while the dialog is being built.
+    """
+    def center():
+        pw, ph = parent.winfo_width(), parent.winfo_height()
+        px, py = parent.winfo_rootx(), parent.winfo_rooty()
+        w, h = dialog.winfo_reqwidth(), dialog.winfo_reqheight()
+        dialog.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+
+    dialog.after_idle(center)
+
+
+class ProgressDialog(tk.Toplevel):
+    """Modal progress window for long-running background operations.
+
+    The caller owns the work and reports progress through :meth:`update_progress`
+    from the Tk thread; the dialog is closed with ``destroy()``. Cancel (or
+    closing the window) sets :attr:`cancelled`, a ``threading.Event`` the
+    worker should check between items.
+    """
+
+    def __init__(self, parent, title: str, total: int):
+        super().__init__(parent)
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+        self.grab_set()
+        self.cancelled = threading.Event()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.message_var = tk.StringVar(value="Starting...")
+        ttk.Label(frame, textvariable=self.message_var, width=50).pack(anchor=tk.W)
+        self.progress = ttk.Progressbar(frame, mode="determinate", length=350,
+                                        maximum=max(total, 1))
+        self.progress.pack(fill=tk.X, pady=(8, 0))
+        self._cancel_btn = ttk.Button(frame, text="Cancel", command=self._on_cancel)
+        self._cancel_btn.pack(pady=(10, 0))
+
+        _center_when_idle(self, parent)
+
+    def update_progress(self, done: int, message: str):
+        self.progress.configure(value=done)
+        self.message_var.set(message)
+
+    def _on_cancel(self):
+        # The worker finishes the item it is on, then the caller closes us
+        self.cancelled.set()
+        self._cancel_btn.configure(state=tk.DISABLED)
+        self.message_var.set("Cancelling...")
+
+
+def _fill_text(text: tk.Text, lines: list[str], batch: int = 1000):
+    """Insert *lines* into *text* a batch at a time.
+
+    Joining thousands of paths into one string doubles the memory held at
+    once; batches keep each Tcl call and temporary string small.
+    """
+    for start in range(0, len(lines), batch):
+        prefix = "\n" if start else ""
+        text.insert(tk.END, prefix + "\n".join(lines[start:start + batch]))
+
+
+def _read_only_list(parent: tk.Misc, lines: list[str]) -> tk.Text:
+    """Pack a scrollable, read-only text box listing *lines* into *parent*."""
+    list_frame = ttk.Frame(parent)
+    list_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+    scrollbar = ttk.Scrollbar(list_frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    text = tk.Text(list_frame, yscrollcommand=scrollbar.set, wrap=tk.NONE,
+                   height=12, width=70, font=("TkDefaultFont", 9))
+    text.pack(fill=tk.BOTH, expand=True)
+    scrollbar.config(command=text.yview)
+    _fill_text(text, lines)
+    text.configure(state=tk.DISABLED)
+    return text
+
+
+class ErrorListDialog(tk.Toplevel):
+    """Scrollable list of errors from a bulk operation.
+
+    Used instead of a message box, whose text is laid out in one piece and
+    can grow taller than the screen.
+    """
+
+    def __init__(self, parent, title: str, message: str, errors: list[str]):
+        super().__init__(parent)
+        self.title(title)
+        self.transient(parent)
+        self.grab_set()
+        self.minsize(450, 250)
+
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=message, wraplength=500).pack(anchor=tk.W)
+
+        _read_only_list(frame, errors)
+
+        ttk.Button(frame, text="Close", command=self.destroy).pack(pady=(10, 0))
+        _center_when_idle(self, parent)
+
+
+class ConfirmListDialog(tk.Toplevel):
+    """Yes/No confirmation showing a scrollable list of affected items.
+
+    Sets ``self.confirmed`` to True when the user accepts.
+    """
+
+    def __init__(self, parent, title: str, message: str, items: list[str],
+                 detail: str = ""):
+        super().__init__(parent)
+        self.title(title)
+        self.confirmed = False
+        self.transient(parent)
+        self.grab_set()
+        self.minsize(450, 250)
+
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=message, wraplength=500).pack(anchor=tk.W)
+
+        _read_only_list(frame, items)
+
+        if detail:
+            ttk.Label(frame, text=detail, wraplength=500).pack(anchor=tk.W, pady=(5, 0))
+
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(pady=(10, 0))
+        ttk.Button(btn_frame, text="Yes", width=10, command=self._on_yes).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="No", width=10, command=self.destroy).pack(side=tk.LEFT, padx=5)
+        self.bind("<Escape>", lambda e: self.destroy())
+
+        _center_when_idle(self, parent)
+
+    def _on_yes(self):
+        self.confirmed = True
+        self.destroy()
@@ -1,7 +1,11 @@
 """File browser panel with tree navigation and file listing."""
 
 import os
+import queue
+import stat
+import threading
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk
 from typing import Callable, Optional
 
@@ -14,9 +18,52 @@ from hardlink_manager.utils.filesystem import (
 )
 
 
+_SCAN_WORKERS = 4
+_scan_jobs: Optional[queue.Queue] = None
+
+
+def _submit_scan(path: str) -> Future:
+    """List *path*'s subfolders on the worker threads shared by all trees.
+
+    The workers are daemon threads, like the app's other background
+    workers, so a listing stuck on an unreachable share cannot keep the
+    process alive after the window closes.
+    """
+    global _scan_jobs
+    if _scan_jobs is None:
+        _scan_jobs = queue.Queue()
+        for i in range(_SCAN_WORKERS):
+            threading.Thread(target=_scan_worker, args=(_scan_jobs,),
+                             name=f"dir-scan-{i}", daemon=True).start()
+    future: Future = Future()
+    _scan_jobs.put((path, future))
+    return future
+
+
+def _scan_worker(jobs: queue.Queue):
+    while True:
+        path, future = jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(_list_subdirs(path))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _list_subdirs(path: str) -> list[tuple[str, str]]:
+    """Return ``(name, path)`` of *path*'s subfolders, sorted by name."""
+    with os.scandir(path) as it:
+        subdirs = [(e.name, e.path) for e in it if e.is_dir(follow_symlinks=False)]
+    subdirs.sort(key=lambda item: item[0].lower())
+    return subdirs
+
+
 class DirectoryTree(ttk.Frame):
     """Tree view for navigating the directory structure."""
 
+    PLACEHOLDER = "Loading\u2026"
+
     def __init__(self, parent, on_select: Optional[Callable[[str], None]] = None):
         super().__init__(parent)
         self.on_select = on_select
@@ -32,6 +79,7 @@ class DirectoryTree(ttk.Frame):
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
 
         self._path_map: dict[str, str] = {}  # tree item id -> filesystem path
+        self._loading: set[str] = set()  # tree item ids being listed
 
     def set_root(self, path: str, label: Optional[str] = None):
         """Set the root directory of the tree."""
@@ -39,21 +87,14 @@ class DirectoryTree(ttk.Frame):
         for item in self.tree.get_children():
             self.tree.delete(item)
         self._path_map.clear()
-
-        path = os.path.abspath(path)
-        if not os.path.isdir(path):
-            return
-
-        display = label or os.path.basename(path) or path
-        node_id = self.tree.insert("", tk.END, text=display, open=False)
-        self._path_map[node_id] = path
-
-        # Add a dummy child so the expand arrow shows
-        if self._has_subdirs(path):
-            self.tree.insert(node_id, tk.END, text="")
+        self._loading.clear()
+        self.add_root(path, label)
 
     def add_root(self, path: str, label: Optional[str] = None):
-        """Add an additional root directory to the tree."""
+        """Add an additional root directory to the tree.
+
+        Nothing below the root is read until it is expanded.
+        """
         path = os.path.abspath(path)
         if not os.path.isdir(path):
             return
@@ -61,46 +102,53 @@ class DirectoryTree(ttk.Frame):
         display = label or os.path.basename(path) or path
         node_id = self.tree.insert("", tk.END, text=display, open=False)
         self._path_map[node_id] = path
+        self._add_placeholder(node_id)
 
-        if self._has_subdirs(path):
-            self.tree.insert(node_id, tk.END, text="")
-
-    def _has_subdirs(self, path: str) -> bool:
-        try:
-            for entry in os.scandir(path):
-                if entry.is_dir(follow_symlinks=False):
-                    return True
-        except PermissionError:
-            pass
-        return False
+    def _add_placeholder(self, node_id: str):
+        """Add a dummy child so the expand arrow shows before listing."""
+        self.tree.insert(node_id, tk.END, text=self.PLACEHOLDER)
 
     def _on_expand(self, event):
         node_id = self.tree.focus()
         path = self._path_map.get(node_id)
-        if not path:
+        if not path or node_id in self._loading:
             return
 
-        # Remove dummy children
-        children = self.tree.get_children(node_id)
-        for child in children:
-            if not self._path_map.get(child):
-                self.tree.delete(child)
-
         # Already populated?
         if any(self._path_map.get(c) for c in self.tree.get_children(node_id)):
             return
 
-        # Populate subdirectories
+        # List the folder on a worker thread; the placeholder stays until
+        # the result is in, so a slow or network folder does not freeze
+        # the window.
+        self._loading.add(node_id)
+        future = _submit_scan(path)
+        self.after(10, self._finish_expand, node_id, future)
+
+    def _finish_expand(self, node_id: str, future: Future):
+        if not future.done():
+            self.after(10, self._finish_expand, node_id, future)
+            return
+        self._loading.discard(node_id)
+        if not self.tree.exists(node_id):
+            return  # The tree was reset meanwhile
+
+        # Remove dummy children
+        for child in self.tree.get_children(node_id):
+            if not self._path_map.get(child):
+                self.tree.delete(child)
+
         try:
-            entries = sorted(os.scandir(path), key=lambda e: e.name.lower())
-            for entry in entries:
-                if entry.is_dir(follow_symlinks=False):
-                    child_id = self.tree.insert(node_id, tk.END, text=entry.name)
-                    self._path_map[child_id] = entry.path
-                    if self._has_subdirs(entry.path):
-                        self.tree.insert(child_id, tk.END, text="")
-        except PermissionError:
-            pass
+            subdirs = future.result()
+        except OSError:
+            return
+        # Children are not probed for subfolders of their own: each gets a
+        # placeholder so the expand arrow shows, and expanding an empty one
+        # just removes it again.
+        for name, child_path in subdirs:
+            child_id = self.tree.insert(node_id, tk.END, text=name)
+            self._path_map[child_id] = child_path
+            self._add_placeholder(child_id)
 
     def _on_select(self, event):
         sel = self.tree.selection()
@@ -125,22 +173,33 @@ class FileListPanel(ttk.Frame):
     """
 
     COLUMNS = ("name", "type", "size", "hardlinks", "inode")
+    LOAD_CHUNK = 500  # rows inserted per event-loop turn
     HEADERS = {"name": "Name", "type": "Type", "size": "Size", "hardlinks": "Links", "inode": "Inode"}
     WIDTHS = {"name": 280, "type": 100, "size": 80, "hardlinks": 60, "inode": 100}
 
     def __init__(self, parent, on_file_select: Optional[Callable[[str], None]] = None,
                  on_file_open: Optional[Callable[[str], None]] = None,
                  on_dir_select: Optional[Callable[[str], None]] = None,
-                 on_dir_open: Optional[Callable[[str], None]] = None):
+                 on_dir_open: Optional[Callable[[str], None]] = None,
+                 on_load_progress: Optional[Callable[[int], None]] = None):
         super().__init__(parent)
         self.on_file_select = on_file_select
         self.on_file_open = on_file_open
         self.on_dir_select = on_dir_select
         self.on_dir_open = on_dir_open
+        # Called with the rows still to insert after each deferred batch
+        self.on_load_progress = on_load_progress
         self.current_dir: Optional[str] = None
         self._item_paths: dict[str, str] = {}   # tree item id -> filesystem path
         self._item_is_dir: dict[str, bool] = {}  # tree item id -> True if directory
         self._item_is_symlink: dict[str, bool] = {}  # tree item id -> True if symlink
+        self._item_stats: dict[str, os.stat_result] = {}  # tree item id -> stat (files only)
+        self._path_items: dict[str, str] = {}  # filesystem path -> tree item id
+        # Rows in display order with their sort keys, so a new row's place
+        # is found by binary search instead of reading every row from Tk
+        self._order_ids: list[str] = []
+        self._order_keys: list[tuple] = []
+        self._item_keys: dict[str, tuple] = {}  # tree item id -> sort key
 
         # Path bar with Up button
         path_bar = ttk.Frame(self)
@@ -184,18 +243,34 @@ class FileListPanel(ttk.Frame):
         self._sort_col = "name"
         self._sort_reverse = False
 
+        # Bumped on every load so leftover row batches of an older one stop
+        self._load_generation = 0
+        self._load_after_id: Optional[str] = None
+        # Rows of the current load not inserted yet
+        self._pending_rows: list[dict] = []
+
     def load_directory(self, path: str):
-        """Load and display the contents of a directory (folders first, then files)."""
+        """Load and display the contents of a directory (folders first, then files).
+
+        The listing is read at once, but rows beyond the first
+        ``LOAD_CHUNK`` are inserted from idle callbacks so a huge directory
+        does not freeze the window.
+        """
         path = os.path.abspath(path)
+        self._cancel_pending_rows()
         self.current_dir = path
         self.path_var.set(path)
         self._item_paths.clear()
         self._item_is_dir.clear()
         self._item_is_symlink.clear()
+        self._item_stats.clear()
+        self._path_items.clear()
+        self._order_ids.clear()
+        self._order_keys.clear()
+        self._item_keys.clear()
 
         # Clear existing items
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self.file_tree.delete(*self.file_tree.get_children())
 
         if not os.path.isdir(path):
             return
@@ -205,73 +280,269 @@ class FileListPanel(ttk.Frame):
         try:
             for entry in os.scandir(path):
                 try:
-                    if entry.is_symlink():
-                        # Folder symlinks: shown as a distinct type
-                        broken = is_symlink_broken(entry.path)
-                        try:
-                            target = read_symlink_target(entry.path)
-                        except OSError:
-                            target = "?"
-                        type_label = "Symlink (broken)" if broken else "Symlink"
-                        dir_entries.append({
-                            "name": entry.name,
-                            "type": type_label,
-                            "size": target,
-                            "hardlinks": "",
-                            "inode": "",
-                            "path": entry.path,
-                            "is_dir": True,
-                            "is_symlink": True,
-                        })
-                    elif entry.is_dir(follow_symlinks=False):
-                        dir_entries.append({
-                            "name": entry.name,
-                            "type": "Folder",
-                            "size": "",
-                            "hardlinks": "",
-                            "inode": "",
-                            "path": entry.path,
-                            "is_dir": True,
-                            "is_symlink": False,
-                        })
-                    elif entry.is_file(follow_symlinks=False):
-                        # Use os.stat() instead of entry.stat() because
-                        # DirEntry.stat() on Windows doesn't populate st_nlink
-                        st = os.stat(entry.path)
-                        file_entries.append({
-                            "name": entry.name,
-                            "type": "File",
-                            "size": format_file_size(st.st_size),
-                            "hardlinks": st.st_nlink,
-                            "inode": st.st_ino,
-                            "path": entry.path,
-                            "is_dir": False,
-                            "is_symlink": False,
-                        })
+                    e = self._describe(entry.name, entry.path, entry.is_symlink(),
+                                       entry.is_dir(follow_symlinks=False),
+                                       entry.is_file(follow_symlinks=False))
                 except OSError:
                     continue
+                if e is None:
+                    continue
+                if e["is_dir"]:
+                    dir_entries.append(e)
+                else:
+                    file_entries.append(e)
         except PermissionError:
             return
 
-        # Sort: folders first (alphabetical), then files (alphabetical)
-        dir_entries.sort(key=lambda e: e["name"].lower())
-        file_entries.sort(key=lambda e: e["name"].lower())
-
-        for e in dir_entries + file_entries:
-            item_id = self.file_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    e["name"],
-                    e["type"],
-                    e["size"],
-                    e["hardlinks"],
-                    e["inode"],
-                ),
-            )
-            self._item_paths[item_id] = e["path"]
-            self._item_is_dir[item_id] = e["is_dir"]
-            self._item_is_symlink[item_id] = e.get("is_symlink", False)
+        # Folders first, then files, each in the active column order
+        rows = dir_entries + file_entries
+        rows.sort(key=self._entry_sort_key, reverse=self._sort_reverse)
+
+        self._pending_rows = rows
+        self._insert_rows(self._load_generation, deferred=False)
+
+    def _insert_rows(self, generation: int, deferred: bool = True):
+        """Insert one batch of pending rows, scheduling the next if any."""
+        self._load_after_id = None
+        if generation != self._load_generation:
+            return
+        batch = self._pending_rows[:self.LOAD_CHUNK]
+        del self._pending_rows[:self.LOAD_CHUNK]
+        for e in batch:
+            # add_row() may have shown an entry before its batch came up
+            if e["path"] not in self._path_items:
+                # Placed by key rather than appended: rows added or a
+                # re-sort made meanwhile may sort after this batch. Pending
+                # rows are kept in order, so this is usually the end anyway.
+                self._insert_row(e)
+        if self._pending_rows:
+            self._load_after_id = self.after_idle(self._insert_rows, generation)
+        if deferred and self.on_load_progress:
+            self.on_load_progress(len(self._pending_rows))
+
+    def _cancel_pending_rows(self):
+        self._load_generation += 1
+        self._pending_rows = []
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+            self._load_after_id = None
+
+    def destroy(self):
+        self._cancel_pending_rows()
+        super().destroy()
+
+    @staticmethod
+    def _describe(name: str, path: str, is_symlink: bool, is_dir: bool,
+                  is_file: bool) -> Optional[dict]:
+        """Build the row description for one directory entry.
+
+        Returns None for entries the panel does not show (devices, sockets).
+        """
+        if is_symlink:
+            # Folder symlinks: shown as a distinct type
+            broken = is_symlink_broken(path)
+            try:
+                target = read_symlink_target(path)
+            except OSError:
+                target = "?"
+            type_label = "Symlink (broken)" if broken else "Symlink"
+            return {
+                "name": name,
+                "type": type_label,
+                "size": target,
+                "hardlinks": "",
+                "inode": "",
+                "path": path,
+                "is_dir": True,
+                "is_symlink": True,
+                "st": None,
+            }
+        if is_dir:
+            return {
+                "name": name,
+                "type": "Folder",
+                "size": "",
+                "hardlinks": "",
+                "inode": "",
+                "path": path,
+                "is_dir": True,
+                "is_symlink": False,
+                "st": None,
+            }
+        if is_file:
+            # Use os.stat() instead of entry.stat() because
+            # DirEntry.stat() on Windows doesn't populate st_nlink
+            st = os.stat(path)
+            return {
+                "name": name,
+                "type": "File",
+                "size": format_file_size(st.st_size),
+                "hardlinks": st.st_nlink,
+                "inode": st.st_ino,
+                "path": path,
+                "is_dir": False,
+                "is_symlink": False,
+                "st": st,
+            }
+        return None
+
+    def _describe_path(self, path: str) -> Optional[dict]:
+        """Like :meth:`_describe`, for a path that has no ``DirEntry``."""
+        try:
+            st = os.lstat(path)
+            return self._describe(os.path.basename(path), path, stat.S_ISLNK(st.st_mode),
+                                  stat.S_ISDIR(st.st_mode), stat.S_ISREG(st.st_mode))
+        except OSError:
+            return None
+
+    def _insert_row(self, e: dict) -> str:
+        """Insert a row at its place in the active sort order."""
+        key = self._entry_sort_key(e)
+        index = self._order_position(key)
+        item_id = self.file_tree.insert(
+            "",
+            index,
+            values=(
+                e["name"],
+                e["type"],
+                e["size"],
+                e["hardlinks"],
+                e["inode"],
+            ),
+        )
+        self._item_paths[item_id] = e["path"]
+        self._item_is_dir[item_id] = e["is_dir"]
+        self._item_is_symlink[item_id] = e["is_symlink"]
+        if e["st"] is not None:
+            self._item_stats[item_id] = e["st"]
+        self._path_items[e["path"]] = item_id
+        self._order_ids.insert(index, item_id)
+        self._order_keys.insert(index, key)
+        self._item_keys[item_id] = key
+        return item_id
+
+    def _forget_row(self, item_id: str):
+        if self._item_keys.pop(item_id, None) is not None:
+            index = self._order_ids.index(item_id)
+            del self._order_ids[index]
+            del self._order_keys[index]
+        path = self._item_paths.pop(item_id, None)
+        self._item_is_dir.pop(item_id, None)
+        self._item_is_symlink.pop(item_id, None)
+        self._item_stats.pop(item_id, None)
+        self._path_items.pop(path, None)
+
+    def _order_position(self, key: tuple) -> int:
+        """Display index for a new row with sort *key* (after equal keys)."""
+        keys = self._order_keys
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (keys[mid] >= key) if self._sort_reverse else (keys[mid] <= key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _refresh_links(self, inodes: set, skip: Optional[str] = None):
+        """Update the rows whose file shares one of *inodes*.
+
+        Adding or removing a hardlink changes the link count shown for
+        every other name of the same file.
+        """
+        if not inodes:
+            return
+        stale = [self._item_paths[item_id] for item_id, st in self._item_stats.items()
+                 if st.st_ino in inodes and self._item_paths[item_id] != skip]
+        for path in stale:
+            self.update_row(path)
+
+    def remove_rows(self, paths: list[str]):
+        """Drop the rows for *paths* without re-listing the directory."""
+        ids = [self._path_items[p] for p in paths if p in self._path_items]
+        if not ids:
+            return
+        inodes = {self._item_stats[i].st_ino for i in ids if i in self._item_stats}
+        self.file_tree.delete(*ids)
+        for item_id in ids:
+            self._forget_row(item_id)
+        self._refresh_links(inodes)
+
+    def add_row(self, path: str):
+        """Show a new entry of the current directory.
+
+        Paths outside the current directory are ignored; an entry that is
+        already listed is refreshed instead.
+        """
+        if not self.current_dir or os.path.dirname(path) != self.current_dir:
+            return
+        if path in self._path_items:
+            self.update_row(path)
+            return
+        e = self._describe_path(path)
+        if e is None:
+            return
+        self._insert_row(e)
+        if e["st"] is not None:
+            self._refresh_links({e["st"].st_ino}, skip=path)
+
+    def update_row(self, path: str):
+        """Re-read one listed entry, removing its row if it has gone."""
+        item_id = self._path_items.get(path)
+        if item_id is None:
+            return
+        e = self._describe_path(path)
+        if e is None or e["is_dir"] != self._item_is_dir[item_id]:
+            self.file_tree.delete(item_id)
+            self._forget_row(item_id)
+            if e is not None:
+                self._insert_row(e)
+            return
+        self.file_tree.item(item_id, values=(
+            e["name"], e["type"], e["size"], e["hardlinks"], e["inode"]))
+        key = self._entry_sort_key(e)
+        if key != self._item_keys[item_id]:
+            # The sorted column changed (e.g. size or link count): move the row
+            index = self._order_ids.index(item_id)
+            del self._order_ids[index]
+            del self._order_keys[index]
+            index = self._order_position(key)
+            self.file_tree.detach(item_id)
+            self.file_tree.move(item_id, "", index)
+            self._order_ids.insert(index, item_id)
+            self._order_keys.insert(index, key)
+            self._item_keys[item_id] = key
+        self._item_is_symlink[item_id] = e["is_symlink"]
+        if e["st"] is not None:
+            self._item_stats[item_id] = e["st"]
+
+    def update_linked_rows(self, path: str):
+        """Re-read *path*'s row and every other listed name of the same file.
+
+        Use after an operation that may have removed *path* or some of its
+        hardlinks, so the remaining names show the new link count.
+        """
+        item_id = self._path_items.get(path)
+        if item_id is None:
+            return
+        if not os.path.lexists(path):
+            self.remove_rows([path])
+            return
+        st = self._item_stats.get(item_id)
+        self.update_row(path)
+        if st is not None:
+            self._refresh_links({st.st_ino}, skip=path)
+
+    def cached_stat(self, path: str) -> Optional[os.stat_result]:
+        """Return the stat taken when *path*'s row was listed, if it is a file.
+
+        Lets selection handlers show size, link count and inode without
+        touching the filesystem again.
+        """
+        item_id = self._path_items.get(path)
+        if item_id is None:
+            return None
+        return self._item_stats.get(item_id)
 
     def get_selected_file(self) -> Optional[str]:
         """Get the selected file path (returns None if a folder is selected)."""
@@ -283,14 +554,18 @@ class FileListPanel(ttk.Frame):
         return None
 
     def get_selected_path(self) -> Optional[str]:
-        """Get the selected path (file or folder)."""
+        """Get the selected path (file or folder).
+
+        Paths handed out by the panel are always absolute: they come from
+        listing ``current_dir``, which is made absolute when loaded.
+        """
         sel = self.file_tree.selection()
         if sel:
             return self._item_paths.get(sel[0])
         return None
 
     def get_selected_paths(self) -> list[str]:
-        """Get all selected paths (files and folders)."""
+        """Get all selected paths (files and folders), each absolute."""
         result = []
         for item_id in self.file_tree.selection():
             path = self._item_paths.get(item_id)
@@ -359,27 +634,41 @@ class FileListPanel(ttk.Frame):
         else:
             self._sort_col = col
             self._sort_reverse = False
+        self._apply_sort()
+        if self._pending_rows:
+            # Later batches follow the new order, so they mostly land at the end
+            self._pending_rows.sort(key=self._entry_sort_key, reverse=self._sort_reverse)
+
+    def _apply_sort(self):
+        """Reorder the inserted rows by the active column."""
+        col = self._sort_col
+        items = [(self._sort_key(self._item_is_dir.get(item, False), self.file_tree.set(item, col)), item)
+                 for item in self.file_tree.get_children()]
+        items.sort(key=lambda pair: pair[0], reverse=self._sort_reverse)
+
+        for index, (_key, item) in enumerate(items):
+            self.file_tree.move(item, "", index)
+        self._order_keys = [key for key, _item in items]
+        self._order_ids = [item for _key, item in items]
+        self._item_keys = dict(zip(self._order_ids, self._order_keys))
 
-        items = [(self.file_tree.set(item, col), item) for item in self.file_tree.get_children()]
-
-        # Always keep folders before files, then sort within each group
-        def sort_key(pair):
-            val, item_id = pair
-            is_dir = self._item_is_dir.get(item_id, False)
-            if col in ("size", "hardlinks", "inode"):
-                try:
-                    num_str = val.split()[0] if val else "0"
-                    num = float(num_str)
-                except (ValueError, IndexError):
-                    num = -1 if is_dir else 0
-                return (0 if is_dir else 1, num)
-            else:
-                return (0 if is_dir else 1, val.lower())
+    def _sort_key(self, is_dir: bool, val: str) -> tuple:
+        """Sort key for a row's value in the active column.
 
-        items.sort(key=sort_key, reverse=self._sort_reverse)
+        Folders always come before files, then rows sort within each group.
+        """
+        if self._sort_col in ("size", "hardlinks", "inode"):
+            try:
+                num_str = val.split()[0] if val else "0"
+                num = float(num_str)
+            except (ValueError, IndexError):
+                num = -1 if is_dir else 0
+            return (0 if is_dir else 1, num)
+        return (0 if is_dir else 1, val.lower())
 
-        for index, (_val, item) in enumerate(items):
-            self.file_tree.move(item, "", index)
+    def _entry_sort_key(self, e: dict) -> tuple:
+        """Like :meth:`_sort_key`, for a row description not yet inserted."""
+        return self._sort_key(e["is_dir"], str(e[self._sort_col]))
 
 
 class TabbedFileBrowser(ttk.Frame):
@@ -393,12 +682,14 @@ class TabbedFileBrowser(ttk.Frame):
                  on_file_select: Optional[Callable[[str], None]] = None,
                  on_file_open: Optional[Callable[[str], None]] = None,
                  on_dir_select: Optional[Callable[[str], None]] = None,
-                 on_dir_open: Optional[Callable[[str], None]] = None):
+                 on_dir_open: Optional[Callable[[str], None]] = None,
+                 on_load_progress: Optional[Callable[[int], None]] = None):
         super().__init__(parent)
         self.on_file_select = on_file_select
         self.on_file_open = on_file_open
         self.on_dir_select = on_dir_select
         self.on_dir_open = on_dir_open
+        self.on_load_progress = on_load_progress
 
         self._tabs: list[FileListPanel] = []
         self._tab_counter = 0
@@ -426,6 +717,7 @@ class TabbedFileBrowser(ttk.Frame):
             on_file_open=self.on_file_open,
             on_dir_select=self.on_dir_select,
             on_dir_open=self.on_dir_open,
+            on_load_progress=self.on_load_progress,
         )
         # Apply any registered bindings to this new panel's tree
         for sequence, handler in self._tree_bindings:
@@ -503,3 +795,18 @@ class TabbedFileBrowser(ttk.Frame):
 
     def is_selected_symlink(self) -> bool:
         return self.active_panel.is_selected_symlink()
+
+    def remove_rows(self, paths: list[str]):
+        self.active_panel.remove_rows(paths)
+
+    def add_row(self, path: str):
+        self.active_panel.add_row(path)
+
+    def update_row(self, path: str):
+        self.active_panel.update_row(path)
+
+    def update_linked_rows(self, path: str):
+        self.active_panel.update_linked_rows(path)
+
+    def cached_stat(self, path: str) -> Optional[os.stat_result]:
+        return self.active_panel.cached_stat(path)
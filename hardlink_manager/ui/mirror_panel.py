@@ -87,7 +87,7 @@ class MirrorGroupPanel(ttk.Frame):
         for group in self.registry.get_all_groups():
             sync_text = "On" if group.sync_enabled else "Off"
             item_id = self.group_tree.insert("", tk.END, values=(
-                group.auto_name(), len(group.folders), sync_text
+                self.registry.group_display_name(group), len(group.folders), sync_text
             ))
             self._group_ids[item_id] = group.id
 
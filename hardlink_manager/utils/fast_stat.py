@@ -0,0 +1,123 @@
+"""Cheap file identity lookups: (device, inode) without a full stat.
+
+On Linux this calls ``statx(2)`` through ctypes, asking only for the type
+and inode fields and passing ``AT_STATX_DONT_SYNC`` so network and FUSE
+filesystems answer from cache. Cached answers can be out of date, so
+identity checks that guard a destructive operation ask for ``synced``
+results instead. Everywhere else (or on kernels/libcs without ``statx``)
+it falls back to ``os.stat``.
+"""
+
+import ctypes
+import errno
+import functools
+import os
+import platform
+from typing import Optional
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_INO = 0x0100
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Mirror of the kernel's ``struct statx`` (256 bytes)."""
+
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_statx():
+    """Return libc's ``statx`` function, or None if it is unavailable."""
+    if platform.system() != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.statx
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                     ctypes.c_uint, ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    return func
+
+
+_statx_broken = False
+
+
+def _statx_dev_ino(path: str, follow_symlinks: bool,
+                   synced: bool) -> Optional[tuple[int, int]]:
+    """Return ``(st_dev, st_ino)`` via statx, or None to request a fallback.
+
+    Raises OSError (e.g. FileNotFoundError) for errors about *path* itself.
+    """
+    global _statx_broken
+    func = _load_statx()
+    if func is None or _statx_broken:
+        return None
+    buf = _Statx()
+    flags = 0 if synced else AT_STATX_DONT_SYNC
+    if not follow_symlinks:
+        flags |= AT_SYMLINK_NOFOLLOW
+    if func(AT_FDCWD, os.fsencode(path), flags,
+            STATX_TYPE | STATX_INO, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EPERM):
+            # Old kernel, or statx blocked by a seccomp filter
+            _statx_broken = True
+            return None
+        raise OSError(err, os.strerror(err), path)
+    if not buf.stx_mask & STATX_INO:
+        return None
+    # Encode the device the same way os.stat() does so the two mix freely.
+    return os.makedev(buf.stx_dev_major, buf.stx_dev_minor), buf.stx_ino
+
+
+def fast_dev_ino(path: str, follow_symlinks: bool = True,
+                 synced: bool = False) -> tuple[int, int]:
+    """Return ``(st_dev, st_ino)`` for *path*, comparable with ``os.stat``.
+
+    With *synced*, network filesystems are asked to revalidate instead of
+    answering from cache, as ``os.stat`` does; use it before deleting or
+    replacing a file based on its identity.
+
+    Raises the same OSError subclasses as ``os.stat`` (FileNotFoundError
+    when *path* does not exist).
+    """
+    result = _statx_dev_ino(path, follow_symlinks, synced)
+    if result is not None:
+        return result
+    st = os.stat(path, follow_symlinks=follow_symlinks)
+    return st.st_dev, st.st_ino
@@ -6,6 +6,18 @@ import stat
 import unicodedata
 
 
+def norm_abspath(path: str) -> str:
+    """Return the normalised absolute form of *path*.
+
+    Equivalent to ``os.path.normpath(os.path.abspath(path))`` but normalises
+    only once, and absolute paths (the usual case) never consult the
+    current directory.
+    """
+    if os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.abspath(path)
+
+
 def get_inode(path: str) -> int:
     """Get the inode (file index number) for a file.
 
@@ -60,6 +72,65 @@ def is_same_volume(path1: str, path2: str) -> bool:
         return stat1.st_dev == stat2.st_dev
 
 
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afs", "ncpfs", "9p",
+    "fuse.sshfs", "fuse.rclone", "davfs", "fuse.davfs2",
+})
+"""Linux filesystem types whose changes may not raise local inotify events."""
+
+
+def _parse_mountinfo(text: str) -> list[tuple[str, str]]:
+    """Return ``(mount_point, fs_type)`` pairs from /proc/self/mountinfo text."""
+    mounts = []
+    for line in text.splitlines():
+        fields = line.split()
+        try:
+            sep = fields.index("-")
+            mount_point = fields[4]
+            fs_type = fields[sep + 1]
+        except (ValueError, IndexError):
+            continue
+        # Whitespace and backslashes in paths are octal-escaped
+        mount_point = (mount_point.replace("\\040", " ").replace("\\011", "\t")
+                       .replace("\\012", "\n").replace("\\134", "\\"))
+        mounts.append((mount_point, fs_type))
+    return mounts
+
+
+def is_network_path(path: str) -> bool:
+    """Check if a path lives on a network filesystem (NFS, SMB, ...).
+
+    Native change notifications are unreliable there, so callers may want
+    to poll instead. Returns False when it cannot be determined.
+    """
+    path = os.path.realpath(path)
+    system = platform.system()
+    if system == "Windows":
+        if path.startswith("\\\\"):
+            return True  # UNC path
+        import ctypes
+        drive = os.path.splitdrive(path)[0]
+        if not drive:
+            return False
+        DRIVE_REMOTE = 4
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    if system == "Linux":
+        try:
+            with open("/proc/self/mountinfo", encoding="utf-8",
+                      errors="surrogateescape") as f:
+                mounts = _parse_mountinfo(f.read())
+        except OSError:
+            return False
+        best, best_type = "", ""
+        for mount_point, fs_type in mounts:
+            prefix = mount_point.rstrip("/") + "/"
+            if ((path == mount_point or path.startswith(prefix))
+                    and len(mount_point) >= len(best)):
+                best, best_type = mount_point, fs_type
+        return best_type in NETWORK_FS_TYPES
+    return False
+
+
 def sanitize_filename(name: str) -> str:
     """Remove characters that are invalid in Windows/NTFS filenames.
 
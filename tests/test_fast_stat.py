@@ -0,0 +1,41 @@
+"""Tests for fast (device, inode) lookups."""
+
+import os
+import pytest
+
+from hardlink_manager.utils.fast_stat import fast_dev_ino
+
+
+class TestFastDevIno:
+    def test_matches_os_stat(self, tmp_path):
+        f = tmp_path / "file.txt"
+        f.write_text("data")
+        st = os.stat(f)
+        assert fast_dev_ino(str(f)) == (st.st_dev, st.st_ino)
+
+    def test_hardlinks_share_identity(self, tmp_path):
+        f = tmp_path / "file.txt"
+        f.write_text("data")
+        link = tmp_path / "link.txt"
+        os.link(f, link)
+        assert fast_dev_ino(str(f)) == fast_dev_ino(str(link))
+
+    def test_synced_matches_os_stat(self, tmp_path):
+        f = tmp_path / "file.txt"
+        f.write_text("data")
+        st = os.stat(f)
+        assert fast_dev_ino(str(f), synced=True) == (st.st_dev, st.st_ino)
+
+    def test_missing_path_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            fast_dev_ino(str(tmp_path / "missing.txt"))
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="no symlink support")
+    def test_no_follow_symlinks(self, tmp_path):
+        link = tmp_path / "dangling"
+        try:
+            os.symlink(str(tmp_path / "nowhere"), link)
+        except OSError:
+            pytest.skip("symlinks not permitted")
+        st = os.lstat(link)
+        assert fast_dev_ino(str(link), follow_symlinks=False) == (st.st_dev, st.st_ino)
@@ -3,7 +3,7 @@
 import os
 import pytest
 
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 from hardlink_manager.utils.filesystem import (
     copy_item,
@@ -12,10 +12,13 @@ from hardlink_manager.utils.filesystem import (
     get_hardlink_count,
     get_inode,
     is_regular_file,
+    is_network_path,
     is_same_volume,
     move_item,
+    norm_abspath,
     reveal_in_explorer,
     sanitize_filename,
+    _parse_mountinfo,
 )
 
 
@@ -44,6 +47,16 @@ class TestGetInode:
         assert get_inode(str(f1)) != get_inode(str(f2))
 
 
+class TestNormAbspath:
+    def test_absolute_path_is_normalised(self, tmp_path):
+        messy = str(tmp_path) + os.sep + "a" + os.sep + ".." + os.sep + "b" + os.sep
+        assert norm_abspath(messy) == os.path.join(str(tmp_path), "b")
+
+    def test_relative_path_uses_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert norm_abspath("x") == os.path.normpath(os.path.abspath("x"))
+
+
 class TestGetHardlinkCount:
     def test_single_file_has_count_1(self, tmp_path):
         f = tmp_path / "test.txt"
@@ -282,3 +295,29 @@ class TestDeleteItem:
     def test_delete_nonexistent(self, tmp_path):
         with pytest.raises(FileNotFoundError):
             delete_item(str(tmp_path / "nonexistent"))
+
+
+class TestIsNetworkPath:
+    MOUNTINFO = (
+        "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+        "40 22 0:35 / /mnt/nas rw,relatime shared:20 - nfs4 nas:/export rw\n"
+        "41 22 0:36 / /mnt/my\\040share rw - cifs //srv/share rw\n"
+    )
+
+    def test_parse_mountinfo(self):
+        assert _parse_mountinfo(self.MOUNTINFO) == [
+            ("/", "ext4"), ("/mnt/nas", "nfs4"), ("/mnt/my share", "cifs"),
+        ]
+
+    @patch("hardlink_manager.utils.filesystem.platform.system", return_value="Linux")
+    def test_longest_mount_point_wins(self, mock_sys):
+        with patch("builtins.open", mock_open(read_data=self.MOUNTINFO)), \
+                patch("os.path.realpath", side_effect=lambda p: p):
+            assert is_network_path("/mnt/nas/movies")
+            assert is_network_path("/mnt/my share")
+            assert not is_network_path("/mnt/nasty")
+            assert not is_network_path("/home/user")
+
+    @patch("hardlink_manager.utils.filesystem.platform.system", return_value="Darwin")
+    def test_unknown_platform_is_local(self, mock_sys, tmp_path):
+        assert not is_network_path(str(tmp_path))
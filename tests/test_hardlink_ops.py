@@ -5,6 +5,7 @@ import tempfile
 import pytest
 
 from hardlink_manager.core.hardlink_ops import (
+    build_inode_index,
     create_hardlink,
     delete_hardlink,
     find_all_hardlinks,
@@ -150,6 +151,43 @@ class TestFindAllHardlinks:
 
         assert len(results) == 1
 
+    def test_single_link_outside_search_dirs(self, tmp_workspace):
+        src = str(tmp_workspace["test_file"])
+
+        assert find_all_hardlinks(src, [str(tmp_workspace["dst_dir"])]) == []
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             find_all_hardlinks("/nonexistent", ["/tmp"])
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="no symlink support")
+    def test_symlinks_are_not_hardlinks(self, tmp_workspace):
+        src = str(tmp_workspace["test_file"])
+        link = create_hardlink(src, str(tmp_workspace["dst_dir"]))
+        try:
+            os.symlink(src, tmp_workspace["dst_dir"] / "alias.txt")
+        except OSError:
+            pytest.skip("symlinks not permitted")
+        root = str(tmp_workspace["root"])
+
+        walked = find_all_hardlinks(src, [root])
+        indexed = find_all_hardlinks(src, [root], index=build_inode_index([root]))
+
+        assert walked == indexed == sorted([src, link])
+
+    def test_uses_inode_index(self, tmp_workspace):
+        src = str(tmp_workspace["test_file"])
+        link = create_hardlink(src, str(tmp_workspace["dst_dir"]))
+        (tmp_workspace["src_dir"] / "single.txt").write_text("alone")
+        root = str(tmp_workspace["root"])
+
+        index = build_inode_index([root, str(tmp_workspace["src_dir"])])
+
+        assert list(index.values()) == [sorted([src, link])]
+        assert find_all_hardlinks(src, [root], index=index) == sorted([src, link])
+        # Entries that no longer match are dropped on lookup
+        os.unlink(link)
+        with open(link, "w") as f:
+            f.write("replaced")
+        os.link(src, os.path.join(str(tmp_workspace["src_dir"]), "keep.txt"))
+        assert find_all_hardlinks(src, [root], index=index) == [src]
@@ -57,6 +57,19 @@ class TestMirrorGroup:
         g = MirrorGroup(folders=["/data/docs"])
         assert g.auto_name() == "docs"
 
+    def test_normalized_folders(self, two_folders):
+        g = MirrorGroup(folders=[two_folders[0] + os.sep, two_folders[1]])
+        assert g.normalized_folders() == (
+            (two_folders[0], two_folders[0] + os.sep),
+            (two_folders[1], two_folders[1] + os.sep),
+        )
+
+    def test_normalized_folders_follows_folder_changes(self, two_folders):
+        g = MirrorGroup(folders=[two_folders[0]])
+        assert len(g.normalized_folders()) == 1
+        g.folders.append(two_folders[1])
+        assert len(g.normalized_folders()) == 2
+
 
 class TestRegistryPersistence:
     def test_save_and_load(self, registry, two_folders, registry_path):
@@ -168,6 +181,24 @@ class TestRegistryQueries:
         assert found is not None
         assert found.id == group.id
 
+    def test_find_group_for_folder_after_changes(self, registry, two_folders, tmp_path):
+        g = registry.create_group(list(two_folders))
+        assert registry.find_group_for_folder(two_folders[1]) is g
+        registry.remove_folder_from_group(g.id, two_folders[1])
+        assert registry.find_group_for_folder(two_folders[1]) is None
+        extra = tmp_path / "folder_c"
+        extra.mkdir()
+        registry.add_folder_to_group(g.id, str(extra))
+        assert registry.find_group_for_folder(str(extra)) is g
+
+    def test_version_bumps_on_change(self, registry, two_folders):
+        v0 = registry.version
+        g = registry.create_group(two_folders)
+        v1 = registry.version
+        assert v1 > v0
+        registry.update_group(g.id, sync_enabled=False)
+        assert registry.version > v1
+
     def test_find_group_for_unknown_folder(self, registry, two_folders):
         registry.create_group(two_folders)
         assert registry.find_group_for_folder("/some/random/path") is None
@@ -185,6 +216,59 @@ class TestRegistryQueries:
         registry.create_group(two_folders)
         assert registry.find_group_for_path("/some/random/path") is None
 
+    def test_find_group_for_path_prefers_innermost_folder(self, registry, two_folders, tmp_path):
+        outer = registry.create_group(list(two_folders))
+        inner_folder = os.path.join(two_folders[0], "inner")
+        inner = registry.create_group([inner_folder, str(tmp_path / "elsewhere")])
+
+        found, root = registry.find_group_for_path(os.path.join(inner_folder, "f.txt"))
+        assert found.id == inner.id
+        assert root == inner_folder
+        found, _root = registry.find_group_for_path(os.path.join(two_folders[0], "f.txt"))
+        assert found.id == outer.id
+        # A sibling sharing the folder name as a prefix is not inside it
+        assert registry.find_group_for_path(inner_folder + "x")[0].id == outer.id
+
+        registry.delete_group(inner.id)
+        found, _root = registry.find_group_for_path(os.path.join(inner_folder, "f.txt"))
+        assert found.id == outer.id
+
+    def test_any_sync_enabled_follows_updates(self, registry, two_folders):
+        assert not registry.any_sync_enabled
+        group = registry.create_group(two_folders, sync_enabled=False)
+        assert not registry.any_sync_enabled
+        registry.update_group(group.id, sync_enabled=True)
+        assert registry.any_sync_enabled
+        registry.delete_group(group.id)
+        assert not registry.any_sync_enabled
+
+    def test_sync_enabled_count(self, registry, two_folders):
+        group = registry.create_group(two_folders)
+        registry.create_group([two_folders[0]], sync_enabled=False)
+        assert registry.sync_enabled_count == 1
+        registry.update_group(group.id, sync_enabled=True)
+        assert registry.sync_enabled_count == 1
+        registry.update_group(group.id, sync_enabled=False)
+        assert registry.sync_enabled_count == 0
+        registry.update_group(group.id, sync_enabled=True)
+        reloaded = MirrorGroupRegistry(registry.path)
+        assert reloaded.sync_enabled_count == 1
+        assert reloaded.group_count == 2
+
+    def test_find_group_only(self, registry, two_folders):
+        group = registry.create_group(two_folders)
+        sub = os.path.join(two_folders[1], "subdir", "file.txt")
+        assert registry.find_group_only(sub).id == group.id
+        assert registry.find_group_only("/some/random/path") is None
+
+    def test_group_display_name_follows_updates(self, registry, two_folders, tmp_path):
+        group = registry.create_group(two_folders)
+        assert registry.group_display_name(group) == "folder_a + folder_b"
+        extra = tmp_path / "folder_c"
+        extra.mkdir()
+        registry.add_folder_to_group(group.id, str(extra))
+        assert registry.group_display_name(group) == "folder_a + folder_b + folder_c"
+
     def test_is_folder_in_group(self, registry, two_folders):
         registry.create_group(two_folders)
         assert registry.is_folder_in_group(two_folders[0]) is True
@@ -10,6 +10,7 @@ from hardlink_manager.core.hardlink_ops import (
 from hardlink_manager.core.mirror_groups import MirrorGroup
 from hardlink_manager.core.sync import (
     sync_symlink_to_group,
+    sync_symlinks_to_group,
     delete_symlink_from_group,
     sync_group,
 )
@@ -227,6 +228,25 @@ class TestSyncSymlinkToGroup:
             assert os.path.islink(dest)
 
 
+class TestSyncSymlinksToGroup:
+    def test_syncs_batch(self, mirror_group, mirror_folders, target_folder):
+        links = []
+        for name in ("ref1", "ref2"):
+            link = os.path.join(mirror_folders[0], "sub", name)
+            os.makedirs(os.path.dirname(link), exist_ok=True)
+            os.symlink(target_folder, link, target_is_directory=True)
+            links.append(link)
+        regular = os.path.join(mirror_folders[0], "plain_dir")
+        os.mkdir(regular)
+
+        synced = sync_symlinks_to_group(links + [regular], mirror_group)
+
+        assert set(synced) == set(links)
+        for created in synced.values():
+            assert len(created) == 2
+            assert all(os.path.islink(p) for p in created)
+
+
 class TestDeleteSymlinkFromGroup:
     def test_deletes_from_all_folders(self, mirror_group, mirror_folders, target_folder):
         # Create and sync a symlink
@@ -299,3 +319,17 @@ class TestSyncGroupWithSymlinks:
         sync_group(mirror_group)
         created = sync_group(mirror_group)
         assert len(created) == 0
+
+    def test_sync_skips_file_symlinks(self, mirror_group, mirror_folders, tmp_path):
+        # Only folder symlinks are mirrored; a symlink to a file is left
+        # alone rather than turned into hardlinks of its target
+        outside = tmp_path / "outside.txt"
+        outside.write_text("data")
+        os.symlink(str(outside), os.path.join(mirror_folders[0], "alias.txt"))
+
+        created = sync_group(mirror_group)
+
+        assert created == {}
+        for folder in mirror_folders[1:]:
+            assert not os.path.lexists(os.path.join(folder, "alias.txt"))
+        assert os.stat(outside).st_nlink == 1
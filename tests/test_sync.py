@@ -3,8 +3,16 @@
 import os
 import pytest
 
-from hardlink_manager.core.mirror_groups import MirrorGroup
-from hardlink_manager.core.sync import sync_file_to_group, sync_group, delete_from_group
+from hardlink_manager.core.mirror_groups import MIRROR_MARKER, MirrorGroup
+from hardlink_manager.core.sync import (
+    PARALLEL_DELETE_MIN_FOLDERS,
+    PARALLEL_SYNC_MIN_FILES,
+    delete_files_from_group,
+    delete_from_group,
+    sync_file_to_group,
+    sync_files_to_group,
+    sync_group,
+)
 from hardlink_manager.utils.filesystem import get_inode
 
 
@@ -115,6 +123,50 @@ class TestSyncFileToGroup:
             assert os.path.exists(dest)
             assert get_inode(dest) == get_inode(src)
 
+    def test_uses_supplied_source_stat(self, mirror_group, mirror_folders):
+        src = os.path.join(mirror_folders[0], "hello.txt")
+        with open(src, "w") as f:
+            f.write("hello")
+
+        created = sync_file_to_group(src, mirror_group, source_st=os.stat(src))
+
+        assert len(created) == 2
+        assert sync_file_to_group(src, mirror_group, source_st=os.stat(src)) == []
+
+    def test_vanished_source_creates_nothing(self, mirror_group, mirror_folders):
+        src = os.path.join(mirror_folders[0], "gone.txt")
+
+        assert sync_file_to_group(src, mirror_group) == []
+        for folder in mirror_folders[1:]:
+            assert os.listdir(folder) == []
+
+
+class TestSyncFilesToGroup:
+    def test_syncs_batch_across_subdirectories(self, mirror_group, mirror_folders):
+        paths = []
+        for sub in ("x", "x", "y"):
+            d = os.path.join(mirror_folders[0], sub)
+            os.makedirs(d, exist_ok=True)
+            p = os.path.join(d, f"f{len(paths)}.txt")
+            with open(p, "w") as f:
+                f.write("data")
+            paths.append(p)
+
+        synced = sync_files_to_group(paths, mirror_group)
+
+        assert set(synced) == set(paths)
+        for src, created in synced.items():
+            assert len(created) == 2
+            for dest in created:
+                assert get_inode(dest) == get_inode(src)
+
+    def test_skips_vanished_and_outside_paths(self, tmp_path, mirror_group, mirror_folders):
+        outside = tmp_path / "outside.txt"
+        outside.write_text("x")
+        missing = os.path.join(mirror_folders[0], "gone.txt")
+
+        assert sync_files_to_group([str(outside), missing], mirror_group) == {}
+
 
 class TestSyncGroup:
     def test_full_sync(self, mirror_group, mirror_folders):
@@ -200,6 +252,49 @@ class TestSyncGroup:
             assert os.path.exists(dest)
             assert get_inode(dest) == get_inode(src)
 
+    def test_sync_group_many_files_across_subdirs(self, mirror_group, mirror_folders):
+        # Enough files to take the parallel path
+        n_files = PARALLEL_SYNC_MIN_FILES + 8
+        for i in range(n_files):
+            sub = os.path.join(mirror_folders[i % 2], f"dir{i % 5}")
+            os.makedirs(sub, exist_ok=True)
+            with open(os.path.join(sub, f"f{i}.txt"), "w") as f:
+                f.write(str(i))
+
+        created = sync_group(mirror_group)
+
+        assert len(created) == n_files * 2
+        for dest, source in created.items():
+            assert get_inode(dest) == get_inode(source)
+        assert sync_group(mirror_group) == {}
+
+    def test_sync_group_skips_mirror_marker(self, mirror_group, mirror_folders):
+        marker = os.path.join(mirror_folders[0], MIRROR_MARKER)
+        with open(marker, "w") as f:
+            f.write("{}")
+
+        created = sync_group(mirror_group)
+
+        assert created == {}
+        for folder in mirror_folders[1:]:
+            assert not os.path.exists(os.path.join(folder, MIRROR_MARKER))
+
+    def test_sync_group_skips_when_file_blocks_directory(self, mirror_folders):
+        mirror_group = MirrorGroup(name="Pair", folders=mirror_folders[:2])
+        sub = os.path.join(mirror_folders[0], "docs")
+        os.makedirs(sub)
+        with open(os.path.join(sub, "readme.txt"), "w") as f:
+            f.write("readme")
+        # A plain file named like the subdirectory in another folder
+        blocker = os.path.join(mirror_folders[1], "docs")
+        with open(blocker, "w") as f:
+            f.write("not a directory")
+
+        created = sync_group(mirror_group)
+
+        assert os.path.isfile(blocker)
+        assert created == {}
+
 
 class TestDeleteFromGroup:
     def test_deletes_from_all_folders(self, mirror_group, mirror_folders):
@@ -252,3 +347,49 @@ class TestDeleteFromGroup:
     def test_delete_nonexistent_file(self, mirror_group):
         deleted = delete_from_group("/nonexistent/file.txt", mirror_group)
         assert deleted == []
+
+
+class TestDeleteFilesFromGroup:
+    def test_deletes_each_file_everywhere(self, mirror_group, mirror_folders):
+        paths = []
+        for name in ("a.txt", "b.txt"):
+            src = os.path.join(mirror_folders[0], name)
+            with open(src, "w") as f:
+                f.write(name)
+            sync_file_to_group(src, mirror_group)
+            paths.append(src)
+        # A hardlink sibling under another name is a separate entry
+        os.link(paths[0], os.path.join(mirror_folders[0], "c.txt"))
+        sync_file_to_group(os.path.join(mirror_folders[0], "c.txt"), mirror_group)
+
+        deleted = delete_files_from_group(paths, mirror_group)
+
+        assert set(deleted) == set(paths)
+        for folder in mirror_folders:
+            assert os.listdir(folder) == ["c.txt"]
+
+    def test_mirror_copies_are_deleted_once(self, mirror_group, mirror_folders):
+        src = os.path.join(mirror_folders[0], "shared.txt")
+        with open(src, "w") as f:
+            f.write("shared")
+        sync_file_to_group(src, mirror_group)
+        copy = os.path.join(mirror_folders[1], "shared.txt")
+
+        deleted = delete_files_from_group([src, copy], mirror_group)
+
+        assert list(deleted) == [src]
+        assert len(deleted[src]) == 3
+
+    def test_small_group_deletes_serially(self, mirror_folders):
+        folders = mirror_folders[:PARALLEL_DELETE_MIN_FOLDERS - 1]
+        group = MirrorGroup(name="Pair", folders=folders, sync_enabled=True)
+        src = os.path.join(folders[0], "pair.txt")
+        with open(src, "w") as f:
+            f.write("pair")
+        sync_file_to_group(src, group)
+
+        deleted = delete_files_from_group([src], group)
+
+        assert deleted[src] == [os.path.join(folder, "pair.txt") for folder in folders]
+        for folder in folders:
+            assert os.listdir(folder) == []
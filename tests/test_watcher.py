@@ -5,8 +5,14 @@ import time
 import threading
 import pytest
 
+from unittest.mock import patch
+
 from hardlink_manager.core.mirror_groups import MirrorGroup, MirrorGroupRegistry
-from hardlink_manager.core.watcher import MirrorGroupWatcher, _DebouncedHandler
+from hardlink_manager.core.watcher import (
+    MirrorGroupWatcher,
+    _covering_roots,
+    _DebouncedHandler,
+)
 from hardlink_manager.utils.filesystem import get_inode
 
 
@@ -112,6 +118,96 @@ class TestMirrorGroupWatcher:
         finally:
             watcher.stop()
 
+    def test_nested_folders_share_one_watch(self, mirror_workspace):
+        registry = mirror_workspace["registry"]
+        inner = os.path.join(mirror_workspace["folder_a"], "inner")
+        other = os.path.join(str(mirror_workspace["tmp_path"]), "other")
+        os.makedirs(inner)
+        os.makedirs(other)
+        registry.create_group([inner, other])
+
+        watcher = MirrorGroupWatcher(registry)
+        watcher.start()
+        try:
+            assert inner not in watcher._watches
+            assert mirror_workspace["folder_a"] in watcher._watches
+        finally:
+            watcher.stop()
+
+    def test_add_group_extends_running_watcher(self, mirror_workspace):
+        registry = mirror_workspace["registry"]
+        tmp_path = mirror_workspace["tmp_path"]
+        watcher = MirrorGroupWatcher(registry)
+        watcher.start()
+        try:
+            first_watch = watcher._watches[mirror_workspace["folder_a"]]
+            new_a, new_b = str(tmp_path / "new_a"), str(tmp_path / "new_b")
+            os.makedirs(new_a)
+            os.makedirs(new_b)
+            watcher.add_group(registry.create_group([new_a, new_b]))
+
+            assert {new_a, new_b} <= set(watcher._watches)
+            # Existing watches are left alone
+            assert watcher._watches[mirror_workspace["folder_a"]] is first_watch
+
+            # A folder containing a watched root takes over its watch
+            watcher.add_folder(mirror_workspace["group"], str(tmp_path))
+            assert list(watcher._watches) == [str(tmp_path)]
+        finally:
+            watcher.stop()
+
+    def test_refresh_applies_registry_changes(self, mirror_workspace):
+        registry = mirror_workspace["registry"]
+        watcher = MirrorGroupWatcher(registry)
+        watcher.start()
+        try:
+            kept = watcher._watches[mirror_workspace["folder_a"]]
+            registry.remove_folder_from_group(mirror_workspace["group"].id,
+                                              mirror_workspace["folder_b"])
+            watcher.refresh()
+
+            assert list(watcher._watches) == [mirror_workspace["folder_a"]]
+            assert watcher._watches[mirror_workspace["folder_a"]] is kept
+        finally:
+            watcher.stop()
+
+    def test_force_polling(self, mirror_workspace):
+        from watchdog.observers.polling import PollingObserver
+
+        watcher = MirrorGroupWatcher(mirror_workspace["registry"], force_polling=True)
+        watcher.start()
+        try:
+            assert watcher.is_running
+            assert all(isinstance(o, PollingObserver) for o in watcher._observers.values())
+        finally:
+            watcher.stop()
+
+    def test_network_folders_are_polled(self, mirror_workspace):
+        from watchdog.observers.polling import PollingObserver
+
+        watcher = MirrorGroupWatcher(mirror_workspace["registry"], network_poll_seconds=30)
+        with patch("hardlink_manager.core.watcher.is_network_path", return_value=True):
+            watcher.start()
+        try:
+            assert watcher.is_running
+            polling = [o for o in watcher._observers.values() if isinstance(o, PollingObserver)]
+            assert len(polling) == 1
+            assert polling[0].timeout == 30
+        finally:
+            watcher.stop()
+        assert not watcher.is_running
+
+
+class TestCoveringRoots:
+    def test_drops_nested_folders(self):
+        a = os.path.join(os.sep, "data", "a")
+        assert _covering_roots([os.path.join(a, "x"), a, a + "-b"]) == [a, a + "-b"]
+
+    def test_keeps_siblings(self):
+        a = os.path.join(os.sep, "data", "a")
+        b = os.path.join(os.sep, "data", "b")
+        assert _covering_roots([b, a, a]) == [a, b]
+
 
 class TestDebouncedHandler:
     def test_debounce_coalesces_events(self, mirror_workspace):
@@ -155,3 +251,81 @@ class TestDebouncedHandler:
         handler.on_created(event)  # Should not raise or schedule anything
 
         assert len(handler._pending) == 0
+
+    def test_rename_into_place_syncs_final_name(self, mirror_workspace):
+        from watchdog.events import FileCreatedEvent, FileMovedEvent
+
+        synced = []
+        sync_event = threading.Event()
+
+        def on_sync(source, created):
+            synced.append(source)
+            sync_event.set()
+
+        handler = _DebouncedHandler(mirror_workspace["registry"], on_sync=on_sync,
+                                    debounce_seconds=0.1)
+        tmp = os.path.join(mirror_workspace["folder_a"], ".saving.tmp")
+        final = os.path.join(mirror_workspace["folder_a"], "saved.txt")
+        with open(tmp, "w") as f:
+            f.write("saved")
+        handler.on_created(FileCreatedEvent(tmp))
+        os.rename(tmp, final)
+        handler.on_moved(FileMovedEvent(tmp, final))
+
+        try:
+            assert sync_event.wait(timeout=3.0)
+            time.sleep(0.2)
+            assert synced == [final]
+            assert not os.path.exists(os.path.join(mirror_workspace["folder_b"], ".saving.tmp"))
+        finally:
+            handler.stop()
+
+    def test_worker_starts_lazily_and_stops(self, mirror_workspace):
+        from watchdog.events import FileCreatedEvent
+
+        handler = _DebouncedHandler(mirror_workspace["registry"], debounce_seconds=10)
+        assert handler._worker is None
+
+        src = os.path.join(mirror_workspace["folder_a"], "lazy.txt")
+        with open(src, "w") as f:
+            f.write("lazy")
+        handler.on_created(FileCreatedEvent(src))
+        assert handler._worker is not None
+
+        handler.stop()
+        assert not handler._worker.is_alive()
+
+    def test_group_lookup_cache_follows_registry(self, mirror_workspace):
+        registry = mirror_workspace["registry"]
+        handler = _DebouncedHandler(registry)
+        path = os.path.join(mirror_workspace["folder_a"], "cached.txt")
+
+        group, _root = handler._find_group(path)
+        assert group.sync_enabled
+
+        registry.update_group(group.id, sync_enabled=False)
+        group, _root = handler._find_group(path)
+        assert not group.sync_enabled
+
+        registry.delete_group(group.id)
+        assert handler._find_group(path) is None
+
+    def test_flush_syncs_one_copy_of_a_linked_file(self, mirror_workspace):
+        synced = []
+        handler = _DebouncedHandler(
+            mirror_workspace["registry"],
+            on_sync=lambda source, created: synced.append(source),
+        )
+        src = os.path.join(mirror_workspace["folder_a"], "twin.txt")
+        with open(src, "w") as f:
+            f.write("twin")
+        twin = os.path.join(mirror_workspace["folder_b"], "twin.txt")
+        os.link(src, twin)
+        sibling = os.path.join(mirror_workspace["folder_a"], "sibling.txt")
+        os.link(src, sibling)
+
+        handler._flush([src, twin, sibling])
+
+        # The twin is already in place, the sibling has its own name
+        assert synced == [sibling]
+        assert get_inode(os.path.join(mirror_workspace["folder_b"], "sibling.txt")) == get_inode(src)